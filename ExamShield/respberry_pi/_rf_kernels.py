@@ -0,0 +1,41 @@
+"""
+ExamShield RF Math Kernels
+Hot arithmetic for the RF receiver, JIT-compiled with Numba when available
+
+Numba is optional: without it the functions run as plain Python/NumPy,
+which keeps the dependency footprint small on boards where Numba's LLVM
+toolchain is impractical to install.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+@njit(cache=True, fastmath=True)
+def rssi_to_distance_arr(rssi_arr):
+    """Convert an array of RSSI values to distances in meters
+
+    Path loss model with n=2 (free space) and A=-30 (reference RSSI at
+    1m), clamped to a 10cm minimum.
+    """
+    return np.maximum(10.0 ** ((-30.0 - rssi_arr) / 20.0), 0.1)
+
+@njit(cache=True)
+def position_confidence(unique_esp32s, avg_rssi):
+    """Confidence from detecting-scanner count and mean signal strength
+
+    Max base confidence with all 4 ESP32s; RSSI normalized to 0.1-1.0.
+    """
+    base_confidence = min(unique_esp32s / 4.0, 1.0)
+    rssi_factor = max(0.1, min(1.0, (avg_rssi + 100.0) / 50.0))
+    return base_confidence * rssi_factor
@@ -1,440 +1,674 @@
-"""
-ExamShield Alert System Module
-Controls laser pointer, buzzer, LED, and servo motors for alerts
-"""
-
-import RPi.GPIO as GPIO
-import time
-import threading
-import logging
-import math
-from queue import Queue
-
-class AlertSystem:
-    def __init__(self, config):
-        self.config = config
-        self.logger = logging.getLogger(__name__)
-
-        # GPIO pins from config
-        self.servo_pin_x = config['alert']['servo_pin_x']
-        self.servo_pin_y = config['alert']['servo_pin_y']
-        self.laser_pin = config['alert']['laser_pin']
-        self.buzzer_pin = config['alert']['buzzer_pin']
-        self.led_pin = config['alert']['led_pin']
-
-        # Alert state
-        self.alert_active = False
-        self.current_target = None
-        self.alert_thread = None
-        self.running = False
-
-        # Servo control
-        self.servo_x = None
-        self.servo_y = None
-        self.servo_frequency = 50  # 50Hz for standard servos
-
-        # Alert queue for multiple simultaneous alerts
-        self.alert_queue = Queue()
-
-        # Servo position limits and calibration
-        self.servo_min_duty = 2.5   # 0 degrees
-        self.servo_max_duty = 12.5  # 180 degrees
-        self.servo_center_duty = 7.5 # 90 degrees
-
-        # Current servo positions
-        self.current_x_angle = 90
-        self.current_y_angle = 90
-
-    def initialize(self):
-        """Initialize GPIO pins and PWM"""
-        try:
-            # Setup GPIO mode
-            GPIO.setmode(GPIO.BOARD)
-
-            # Setup output pins
-            GPIO.setup(self.servo_pin_x, GPIO.OUT)
-            GPIO.setup(self.servo_pin_y, GPIO.OUT)
-            GPIO.setup(self.laser_pin, GPIO.OUT)
-            GPIO.setup(self.buzzer_pin, GPIO.OUT)
-            GPIO.setup(self.led_pin, GPIO.OUT)
-
-            # Initialize servo PWM
-            self.servo_x = GPIO.PWM(self.servo_pin_x, self.servo_frequency)
-            self.servo_y = GPIO.PWM(self.servo_pin_y, self.servo_frequency)
-
-            # Start PWM with center position
-            self.servo_x.start(self.servo_center_duty)
-            self.servo_y.start(self.servo_center_duty)
-
-            # Initialize all outputs to OFF
-            GPIO.output(self.laser_pin, GPIO.LOW)
-            GPIO.output(self.buzzer_pin, GPIO.LOW)
-            GPIO.output(self.led_pin, GPIO.LOW)
-
-            # Small delay for servo initialization
-            time.sleep(1)
-
-            self.logger.info("Alert system initialized")
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Failed to initialize alert system: {e}")
-            return False
-
-    def start(self):
-        """Start alert system"""
-        if not self.initialize():
-            return False
-
-        self.running = True
-
-        # Start alert processing thread
-        self.alert_thread = threading.Thread(target=self._process_alerts)
-        self.alert_thread.daemon = True
-        self.alert_thread.start()
-
-        self.logger.info("Alert system started")
-        return True
-
-    def _process_alerts(self):
-        """Process alert queue continuously"""
-        while self.running:
-            try:
-                if not self.alert_queue.empty():
-                    alert_data = self.alert_queue.get()
-                    self._execute_alert(alert_data)
-
-                time.sleep(0.1)
-
-            except Exception as e:
-                self.logger.error(f"Error processing alerts: {e}")
-
-    def trigger_alert(self, target_position, alert_type="device_detected", duration=None):
-        """Queue an alert for processing"""
-        if duration is None:
-            duration = self.config['alert']['alert_duration']
-
-        alert_data = {
-            'target_position': target_position,
-            'alert_type': alert_type,
-            'duration': duration,
-            'timestamp': time.time()
-        }
-
-        self.alert_queue.put(alert_data)
-        self.logger.info(f"Alert queued: {alert_type} at position {target_position}")
-
-    def _execute_alert(self, alert_data):
-        """Execute a single alert"""
-        target_pos = alert_data['target_position']
-        alert_type = alert_data['alert_type']
-        duration = alert_data['duration']
-
-        try:
-            self.alert_active = True
-            self.current_target = target_pos
-
-            # Point laser at target
-            if target_pos:
-                self.point_laser_at_position(target_pos)
-
-            # Activate visual and audio alerts based on type
-            if alert_type == "device_detected":
-                self._device_detected_alert(duration)
-            elif alert_type == "high_confidence":
-                self._high_confidence_alert(duration)
-            elif alert_type == "test_alert":
-                self._test_alert(duration)
-
-            self.alert_active = False
-            self.current_target = None
-
-        except Exception as e:
-            self.logger.error(f"Error executing alert: {e}")
-            self.alert_active = False
-
-    def _device_detected_alert(self, duration):
-        """Standard device detection alert"""
-        end_time = time.time() + duration
-
-        while time.time() < end_time and self.running:
-            # Turn on laser and LED
-            GPIO.output(self.laser_pin, GPIO.HIGH)
-            GPIO.output(self.led_pin, GPIO.HIGH)
-
-            # Brief buzzer beep
-            GPIO.output(self.buzzer_pin, GPIO.HIGH)
-            time.sleep(0.2)
-            GPIO.output(self.buzzer_pin, GPIO.LOW)
-
-            # Keep laser and LED on for visibility
-            time.sleep(1.8)  # Total 2 seconds per cycle
-
-            # Brief off period
-            GPIO.output(self.laser_pin, GPIO.LOW)
-            GPIO.output(self.led_pin, GPIO.LOW)
-            time.sleep(0.5)
-
-    def _high_confidence_alert(self, duration):
-        """High confidence detection alert (more intense)"""
-        end_time = time.time() + duration
-
-        while time.time() < end_time and self.running:
-            # Rapid flashing laser and LED with continuous buzzer
-            for _ in range(5):  # 5 rapid flashes
-                GPIO.output(self.laser_pin, GPIO.HIGH)
-                GPIO.output(self.led_pin, GPIO.HIGH)
-                GPIO.output(self.buzzer_pin, GPIO.HIGH)
-                time.sleep(0.1)
-
-                GPIO.output(self.laser_pin, GPIO.LOW)
-                GPIO.output(self.led_pin, GPIO.LOW)
-                GPIO.output(self.buzzer_pin, GPIO.LOW)
-                time.sleep(0.1)
-
-            # Longer pause
-            time.sleep(1)
-
-    def _test_alert(self, duration):
-        """Test alert pattern"""
-        # Simple on/off pattern for testing
-        GPIO.output(self.laser_pin, GPIO.HIGH)
-        GPIO.output(self.led_pin, GPIO.HIGH)
-        GPIO.output(self.buzzer_pin, GPIO.HIGH)
-
-        time.sleep(duration)
-
-        GPIO.output(self.laser_pin, GPIO.LOW)
-        GPIO.output(self.led_pin, GPIO.LOW)
-        GPIO.output(self.buzzer_pin, GPIO.LOW)
-
-    def point_laser_at_position(self, position, image_width=32, image_height=24):
-        """Point laser at specified position using servo control"""
-        try:
-            x, y = position
-
-            # Convert image coordinates to servo angles
-            # Map thermal sensor coordinates (32x24) to servo range (0-180 degrees)
-            angle_x = int((x / image_width) * 180)
-            angle_y = int((y / image_height) * 180)
-
-            # Clamp angles to valid range
-            angle_x = max(0, min(angle_x, 180))
-            angle_y = max(0, min(angle_y, 180))
-
-            # Move servos to target position
-            self.move_servo(angle_x, angle_y)
-
-            self.logger.debug(f"Laser pointed to position ({x}, {y}) -> angles ({angle_x}, {angle_y})")
-
-        except Exception as e:
-            self.logger.error(f"Error pointing laser: {e}")
-
-    def move_servo(self, x_angle, y_angle):
-        """Move servos to specified angles"""
-        try:
-            # Convert angles to duty cycles
-            x_duty = self._angle_to_duty_cycle(x_angle)
-            y_duty = self._angle_to_duty_cycle(y_angle)
-
-            # Smooth movement if large angle change
-            if abs(x_angle - self.current_x_angle) > 30 or abs(y_angle - self.current_y_angle) > 30:
-                self._smooth_servo_move(x_angle, y_angle)
-            else:
-                # Direct movement for small changes
-                self.servo_x.ChangeDutyCycle(x_duty)
-                self.servo_y.ChangeDutyCycle(y_duty)
-                time.sleep(0.1)  # Allow servo to reach position
-
-            self.current_x_angle = x_angle
-            self.current_y_angle = y_angle
-
-        except Exception as e:
-            self.logger.error(f"Error moving servo: {e}")
-
-    def _smooth_servo_move(self, target_x, target_y):
-        """Smooth servo movement for large angle changes"""
-        steps = 10  # Number of intermediate steps
-
-        start_x = self.current_x_angle
-        start_y = self.current_y_angle
-
-        for i in range(steps + 1):
-            progress = i / steps
-
-            # Linear interpolation
-            current_x = start_x + (target_x - start_x) * progress
-            current_y = start_y + (target_y - start_y) * progress
-
-            x_duty = self._angle_to_duty_cycle(current_x)
-            y_duty = self._angle_to_duty_cycle(current_y)
-
-            self.servo_x.ChangeDutyCycle(x_duty)
-            self.servo_y.ChangeDutyCycle(y_duty)
-
-            time.sleep(0.05)  # Small delay for smooth movement
-
-    def _angle_to_duty_cycle(self, angle):
-        """Convert servo angle (0-180) to PWM duty cycle"""
-        # Linear mapping from angle to duty cycle
-        duty_cycle = self.servo_min_duty + (angle / 180.0) * (self.servo_max_duty - self.servo_min_duty)
-        return duty_cycle
-
-    def center_servos(self):
-        """Move servos to center position"""
-        self.move_servo(90, 90)
-        self.logger.info("Servos centered")
-
-    def test_servos(self):
-        """Test servo movement through full range"""
-        self.logger.info("Testing servo movement...")
-
-        # Test X-axis servo
-        for angle in [0, 45, 90, 135, 180, 90]:
-            self.move_servo(angle, 90)
-            time.sleep(1)
-
-        # Test Y-axis servo
-        for angle in [0, 45, 90, 135, 180, 90]:
-            self.move_servo(90, angle)
-            time.sleep(1)
-
-        self.logger.info("Servo test completed")
-
-    def test_laser(self, duration=2):
-        """Test laser on/off"""
-        self.logger.info("Testing laser...")
-        GPIO.output(self.laser_pin, GPIO.HIGH)
-        time.sleep(duration)
-        GPIO.output(self.laser_pin, GPIO.LOW)
-        self.logger.info("Laser test completed")
-
-    def test_buzzer(self, duration=1):
-        """Test buzzer"""
-        self.logger.info("Testing buzzer...")
-        GPIO.output(self.buzzer_pin, GPIO.HIGH)
-        time.sleep(duration)
-        GPIO.output(self.buzzer_pin, GPIO.LOW)
-        self.logger.info("Buzzer test completed")
-
-    def test_led(self, duration=2):
-        """Test LED"""
-        self.logger.info("Testing LED...")
-        GPIO.output(self.led_pin, GPIO.HIGH)
-        time.sleep(duration)
-        GPIO.output(self.led_pin, GPIO.LOW)
-        self.logger.info("LED test completed")
-
-    def emergency_stop(self):
-        """Emergency stop - turn off all alerts immediately"""
-        try:
-            GPIO.output(self.laser_pin, GPIO.LOW)
-            GPIO.output(self.buzzer_pin, GPIO.LOW)
-            GPIO.output(self.led_pin, GPIO.LOW)
-
-            # Clear alert queue
-            while not self.alert_queue.empty():
-                try:
-                    self.alert_queue.get_nowait()
-                except:
-                    break
-
-            self.alert_active = False
-            self.current_target = None
-
-            self.logger.info("Emergency stop activated")
-
-        except Exception as e:
-            self.logger.error(f"Error in emergency stop: {e}")
-
-    def get_status(self):
-        """Get current alert system status"""
-        return {
-            'alert_active': self.alert_active,
-            'current_target': self.current_target,
-            'current_x_angle': self.current_x_angle,
-            'current_y_angle': self.current_y_angle,
-            'queue_size': self.alert_queue.qsize()
-        }
-
-    def stop(self):
-        """Stop alert system and cleanup"""
-        self.running = False
-        self.logger.info("Stopping alert system...")
-
-        # Turn off all outputs
-        try:
-            GPIO.output(self.laser_pin, GPIO.LOW)
-            GPIO.output(self.buzzer_pin, GPIO.LOW)
-            GPIO.output(self.led_pin, GPIO.LOW)
-        except:
-            pass
-
-        # Stop PWM
-        try:
-            if self.servo_x:
-                self.servo_x.stop()
-            if self.servo_y:
-                self.servo_y.stop()
-        except:
-            pass
-
-        # Wait for thread to finish
-        if self.alert_thread:
-            self.alert_thread.join(timeout=2)
-
-        # Cleanup GPIO
-        try:
-            GPIO.cleanup()
-        except:
-            pass
-
-        self.logger.info("Alert system stopped")
-
-# Test function
-def test_alert_system():
-    """Test alert system functionality"""
-    from utils import load_config, setup_logging
-
-    config = load_config()
-    if not config:
-        print("Failed to load config")
-        return
-
-    setup_logging(config['system']['log_level'])
-
-    alert_system = AlertSystem(config)
-
-    try:
-        if alert_system.start():
-            print("Alert system started")
-
-            # Test individual components
-            print("Testing servos...")
-            alert_system.test_servos()
-
-            print("Testing laser...")
-            alert_system.test_laser()
-
-            print("Testing buzzer...")
-            alert_system.test_buzzer()
-
-            print("Testing LED...")
-            alert_system.test_led()
-
-            # Test alert at specific position
-            print("Testing alert at position (16, 12)...")
-            alert_system.trigger_alert((16, 12), "test_alert", 3)
-            time.sleep(4)
-
-            print("Test completed")
-        else:
-            print("Failed to start alert system")
-
-    except KeyboardInterrupt:
-        print("\nTest interrupted")
-    finally:
-        alert_system.stop()
-
-if __name__ == "__main__":
-    test_alert_system()
+"""
+ExamShield Alert System Module
+Controls laser pointer, buzzer, LED, and servo motors for alerts
+"""
+
+import pigpio
+import numpy as np
+import os
+import time
+import threading
+import logging
+import math
+from collections import deque
+from queue import Empty
+
+# Physical (BOARD) header pin -> BCM GPIO number.
+# Config keeps physical pin numbers for wiring clarity; pigpio needs BCM.
+BOARD_TO_BCM = {
+    3: 2, 5: 3, 7: 4, 8: 14, 10: 15, 11: 17, 12: 18, 13: 27,
+    15: 22, 16: 23, 18: 24, 19: 10, 21: 9, 22: 25, 23: 11, 24: 8,
+    26: 7, 29: 5, 31: 6, 32: 12, 33: 13, 35: 19, 36: 16, 37: 26,
+    38: 20, 40: 21
+}
+
+# CPU core reserved for alert timing (boot cmdline: isolcpus=3 nohz_full=3 rcu_nocbs=3)
+ALERT_CPU_CORE = 3
+# SCHED_FIFO priority (requires rtprio entry in /etc/security/limits.conf)
+ALERT_RT_PRIORITY = 80
+
+class AlertRingBuffer:
+    """
+    Multi-producer/single-consumer ring buffer for alert dispatch.
+    Producers (the detection thread, GUI test alerts and stop()'s
+    sentinel) and the consumer (_process_alerts) all update head/tail
+    under one small lock, held only for the index bookkeeping and never
+    across the blocking wait - so a clear() racing a get(), or put()'s
+    overflow head bump racing the consumer, can't lose an update and
+    strand head on a nulled slot. On overflow the oldest alert is
+    overwritten so fresh detections are never blocked behind stale
+    queued ones.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.buffer = [None] * capacity
+        self.head = 0  # Next slot to read
+        self.tail = 0  # Next slot to write
+        self.overflow_count = 0
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    def put(self, item):
+        """Add an item, dropping the oldest entry if the buffer is full"""
+        with self._lock:
+            if self.tail - self.head >= self.capacity:
+                self.head += 1
+                self.overflow_count += 1
+            self.buffer[self.tail % self.capacity] = item
+            self.tail += 1
+        self._ready.set()
+
+    def get(self, timeout=None):
+        """Get the next item, blocking up to timeout seconds"""
+        if self.head == self.tail:
+            self._ready.clear()
+            # Re-check after clear in case a producer raced the wait
+            if self.head == self.tail and not self._ready.wait(timeout):
+                raise Empty
+        with self._lock:
+            # clear() may have emptied the buffer while we waited
+            if self.head == self.tail:
+                raise Empty
+            index = self.head % self.capacity
+            item = self.buffer[index]
+            self.buffer[index] = None
+            self.head += 1
+        return item
+
+    def qsize(self):
+        """Number of queued items (lock-free integer subtraction)"""
+        return self.tail - self.head
+
+    def clear(self):
+        """Discard all queued items"""
+        with self._lock:
+            self.head = self.tail
+            self.buffer = [None] * self.capacity
+
+class AlertSystem:
+    def __init__(self, config, image_width=32, image_height=24):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+
+        # Thermal image -> servo angle scale factors (precomputed
+        # reciprocals, so pointing needs no division per call)
+        self._x_scale = 180.0 / image_width
+        self._y_scale = 180.0 / image_height
+
+        # GPIO pins from config (physical pin numbers, converted to BCM for pigpio)
+        self.servo_pin_x = BOARD_TO_BCM[config['alert']['servo_pin_x']]
+        self.servo_pin_y = BOARD_TO_BCM[config['alert']['servo_pin_y']]
+        self.laser_pin = BOARD_TO_BCM[config['alert']['laser_pin']]
+        self.buzzer_pin = BOARD_TO_BCM[config['alert']['buzzer_pin']]
+        self.led_pin = BOARD_TO_BCM[config['alert']['led_pin']]
+
+        # Cache hot-path config values as attributes (dict-of-dict lookups
+        # cost on every trigger_alert call)
+        self.default_alert_duration = config['alert']['alert_duration']
+
+        # Alert state
+        self.alert_active = False
+        self.current_target = None
+        self.alert_thread = None
+        self.running = False
+
+        # Set by stop()/emergency_stop() to interrupt in-progress alert
+        # waits instead of letting a multi-second cycle finish. The
+        # generation counter makes emergency stops lost-wakeup-proof:
+        # the event pulse only reaches a thread already blocked in
+        # wait(), so alert waits capture the generation up front and
+        # treat any change as an interrupt (see _wait_interruptible)
+        self._stop_event = threading.Event()
+        self._stop_gen = 0
+
+        # pigpio connection (DMA-backed servo pulses, no software PWM jitter)
+        self.pi = None
+
+        # Precomputed GPIO bit masks so grouped pin toggles become a single
+        # GPSET0/GPCLR0 register write instead of one call per pin
+        self._laser_bit = 1 << self.laser_pin
+        self._buzzer_bit = 1 << self.buzzer_pin
+        self._led_bit = 1 << self.led_pin
+        self._laser_led_mask = self._laser_bit | self._led_bit
+        self._all_on_mask = self._laser_bit | self._led_bit | self._buzzer_bit
+
+        # Servo pulse width limits (microseconds)
+        self.servo_min_pulse = 500    # 0 degrees
+        self.servo_max_pulse = 2500   # 180 degrees
+        self.servo_center_pulse = 1500  # 90 degrees
+
+        # Alert queue for multiple simultaneous alerts (MPSC, lock-free reads)
+        self.alert_queue = AlertRingBuffer()
+
+        # Last enqueued alert, used to coalesce detection bursts:
+        # (target_position, alert_type, deadline)
+        self._last_enqueued = None
+
+        # Targets closer than this (thermal pixels) count as the same spot
+        self.coalesce_distance = 2
+
+        # Free list of alert_data dicts, recycled by _execute_alert so
+        # detection bursts don't churn the allocator
+        self._alert_pool = deque(maxlen=64)
+
+        # Current servo positions
+        self.current_x_angle = 90
+        self.current_y_angle = 90
+
+        # Moves below this are within hobby-servo deadband; skip them
+        self.servo_resolution = 2  # degrees
+
+        # Precomputed pulse width per whole degree so the servo hot path is
+        # a single table index instead of FP math per step
+        pulse_span = self.servo_max_pulse - self.servo_min_pulse
+        self._pulse_table = [
+            int(self.servo_min_pulse + (a / 180.0) * pulse_span)
+            for a in range(181)
+        ]
+        # NumPy view of the same table for vectorized trajectory gathers
+        self._pulse_lut = np.array(self._pulse_table, dtype=np.int32)
+
+        # Alert-type -> bound handler; O(1) dispatch instead of an
+        # if/elif chain of string compares per alert
+        self._alert_handlers = {
+            "device_detected": self._device_detected_alert,
+            "high_confidence": self._high_confidence_alert,
+            "test_alert": self._test_alert,
+        }
+
+    def initialize(self):
+        """Initialize pigpio connection and output pins"""
+        try:
+            # Connect to pigpio daemon
+            self.pi = pigpio.pi()
+            if not self.pi.connected:
+                self.logger.error("Cannot connect to pigpiod - is the daemon running?")
+                return False
+
+            # Setup output pins
+            for pin in [self.laser_pin, self.buzzer_pin, self.led_pin]:
+                self.pi.set_mode(pin, pigpio.OUTPUT)
+
+            # Start servos at center position (hardware-timed pulses)
+            self.pi.set_servo_pulsewidth(self.servo_pin_x, self.servo_center_pulse)
+            self.pi.set_servo_pulsewidth(self.servo_pin_y, self.servo_center_pulse)
+
+            # Initialize all outputs to OFF (single register write)
+            self.pi.clear_bank_1(self._all_on_mask)
+
+            # Small delay for servo initialization
+            time.sleep(1)
+
+            self.logger.info("Alert system initialized")
+            return True
+
+        except Exception as e:
+            self.logger.error("Failed to initialize alert system: %s", e)
+            return False
+
+    def start(self):
+        """Start alert system"""
+        if not self.initialize():
+            return False
+
+        self.running = True
+
+        # Start alert processing thread
+        self.alert_thread = threading.Thread(target=self._process_alerts)
+        self.alert_thread.daemon = True
+        self.alert_thread.start()
+
+        self.logger.info("Alert system started")
+        return True
+
+    def _set_realtime_scheduling(self):
+        """Pin the alert thread to its isolated core with SCHED_FIFO priority"""
+        # Keeps CFS from migrating/preempting the thread mid-pulse; both calls
+        # need privileges, so fall back to default scheduling if refused
+        try:
+            os.sched_setaffinity(0, {ALERT_CPU_CORE})
+        except OSError as e:
+            self.logger.warning("Could not pin alert thread to CPU %s: %s", ALERT_CPU_CORE, e)
+
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(ALERT_RT_PRIORITY))
+        except OSError as e:
+            self.logger.warning("Could not set SCHED_FIFO priority %s: %s", ALERT_RT_PRIORITY, e)
+
+    def _process_alerts(self):
+        """Process alert queue continuously"""
+        self._set_realtime_scheduling()
+
+        while self.running:
+            try:
+                # Block until an alert arrives; timeout lets us re-check running
+                alert_data = self.alert_queue.get(timeout=0.5)
+                if alert_data is None:
+                    # Shutdown sentinel from stop(); only honored once
+                    # running is false so a stray None can't kill the
+                    # thread mid-session
+                    if not self.running:
+                        break
+                    continue
+                self._execute_alert(alert_data)
+
+            except Empty:
+                continue
+            except Exception as e:
+                self.logger.error("Error processing alerts: %s", e)
+
+    def trigger_alert(self, target_position, alert_type="device_detected", duration=None):
+        """Queue an alert for processing"""
+        if duration is None:
+            duration = self.default_alert_duration
+
+        # Coalesce bursts: a repeat alert of the same type at (nearly) the
+        # same spot while the previous one is still running adds nothing but
+        # servo travel, so drop it
+        # Monotonic clock for the coalescing deadline - wall clock can jump
+        # when NTP steps the time
+        now = time.monotonic()
+        if self._last_enqueued:
+            last_pos, last_type, deadline = self._last_enqueued
+            if (alert_type == last_type and now < deadline
+                    and last_pos and target_position
+                    and math.hypot(target_position[0] - last_pos[0],
+                                   target_position[1] - last_pos[1]) < self.coalesce_distance):
+                self.logger.debug("Coalesced duplicate %s alert at %s", alert_type, target_position)
+                return
+
+        self._last_enqueued = (target_position, alert_type, now + duration)
+
+        # Reuse a pooled dict when one is available
+        alert_data = self._alert_pool.pop() if self._alert_pool else {}
+        alert_data['target_position'] = target_position
+        alert_data['alert_type'] = alert_type
+        alert_data['duration'] = duration
+        alert_data['timestamp'] = time.time()
+
+        self.alert_queue.put(alert_data)
+        self.logger.info("Alert queued: %s at position %s", alert_type, target_position)
+
+    def _execute_alert(self, alert_data):
+        """Execute a single alert"""
+        target_pos = alert_data['target_position']
+        alert_type = alert_data['alert_type']
+        duration = alert_data['duration']
+
+        try:
+            self.alert_active = True
+            self.current_target = target_pos
+
+            # Point laser at target
+            if target_pos:
+                self.point_laser_at_position(target_pos)
+
+            # Activate visual and audio alerts based on type
+            handler = self._alert_handlers.get(alert_type)
+            if handler:
+                handler(duration)
+
+            self.alert_active = False
+            self.current_target = None
+
+        except Exception as e:
+            self.logger.error("Error executing alert: %s", e)
+            self.alert_active = False
+        finally:
+            # Recycle the dict back into the pool
+            alert_data.clear()
+            self._alert_pool.append(alert_data)
+
+    def _wait_interruptible(self, timeout, gen):
+        """Sleep up to timeout seconds, waking early on stop/emergency stop
+
+        Returns True if interrupted. gen is the value of _stop_gen the
+        caller captured before starting its alert work; a changed
+        generation means an emergency stop fired while this thread was
+        between waits (e.g. mid wave setup), where the event pulse alone
+        would have been lost.
+        """
+        if self._stop_gen != gen:
+            return True
+        if self._stop_event.wait(timeout):
+            return True
+        return self._stop_gen != gen
+
+    def _run_waveform(self, pulses, duration):
+        """Repeat a pigpio waveform for the given duration in seconds"""
+        # The DMA engine replays the pulse train with exact timing while
+        # Python just waits out the alert duration
+        gen = self._stop_gen
+        wave_id = None
+        deadline = time.monotonic() + duration
+        try:
+            self.pi.wave_clear()
+            self.pi.wave_add_generic(pulses)
+            wave_id = self.pi.wave_create()
+            self.pi.wave_send_repeat(wave_id)
+            # Wait against an absolute monotonic deadline so wave setup
+            # time doesn't extend the alert; the generation check catches
+            # an emergency stop that fired during setup, so the finally
+            # block tears the wave down immediately
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                self._wait_interruptible(remaining, gen)
+        finally:
+            self.pi.wave_tx_stop()
+            if wave_id is not None:
+                self.pi.wave_delete(wave_id)
+            # Ensure all alert outputs end low
+            self.pi.clear_bank_1(self._all_on_mask)
+
+    def _device_detected_alert(self, duration):
+        """Standard device detection alert"""
+        # One 2.5 s cycle: beep with laser+LED on, hold, then brief off period
+        pulses = [
+            pigpio.pulse(self._laser_led_mask | self._buzzer_bit, 0, 200000),
+            pigpio.pulse(0, self._buzzer_bit, 1800000),
+            pigpio.pulse(0, self._laser_led_mask, 500000),
+        ]
+        self._run_waveform(pulses, duration)
+
+    def _high_confidence_alert(self, duration):
+        """High confidence detection alert (more intense)"""
+        # 5 rapid all-on flashes followed by a 1 s pause
+        pulses = []
+        for _ in range(5):
+            pulses.append(pigpio.pulse(self._all_on_mask, 0, 100000))
+            pulses.append(pigpio.pulse(0, self._all_on_mask, 100000))
+        pulses.append(pigpio.pulse(0, 0, 1000000))
+
+        self._run_waveform(pulses, duration)
+
+    def _test_alert(self, duration):
+        """Test alert pattern"""
+        # Simple on/off pattern for testing; all pins switch in one write
+        gen = self._stop_gen
+        self.pi.set_bank_1(self._all_on_mask)
+        self._wait_interruptible(duration, gen)
+        self.pi.clear_bank_1(self._all_on_mask)
+
+    def point_laser_at_position(self, position):
+        """Point laser at specified position using servo control"""
+        # Called once per detection; no try/except here - _execute_alert
+        # already wraps the caller
+        x, y = position
+
+        # Map thermal sensor coordinates to servo range via precomputed
+        # scale factors, clamped to 0-180 degrees
+        angle_x = min(180, max(0, int(x * self._x_scale)))
+        angle_y = min(180, max(0, int(y * self._y_scale)))
+
+        self.move_servo(angle_x, angle_y)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Laser pointed to position (%s, %s) -> angles (%s, %s)",
+                              x, y, angle_x, angle_y)
+
+    def move_servo(self, x_angle, y_angle):
+        """Move servos to specified angles"""
+        try:
+            dx = abs(x_angle - self.current_x_angle)
+            dy = abs(y_angle - self.current_y_angle)
+
+            # Delta the servo can't physically resolve - skip the move and
+            # its settle delay entirely
+            if dx < self.servo_resolution and dy < self.servo_resolution:
+                return
+
+            # Smooth movement if large angle change
+            if dx > 30 or dy > 30:
+                self._smooth_servo_move(x_angle, y_angle)
+            else:
+                # Direct movement for small changes
+                self.pi.set_servo_pulsewidth(self.servo_pin_x, self._angle_to_pulse_width(x_angle))
+                self.pi.set_servo_pulsewidth(self.servo_pin_y, self._angle_to_pulse_width(y_angle))
+                # Settle time scales with travel; a fixed 100 ms is wasted
+                # on small moves
+                self._stop_event.wait(max(0.02, max(dx, dy) * 0.003))
+
+            self.current_x_angle = x_angle
+            self.current_y_angle = y_angle
+
+        except Exception as e:
+            self.logger.error("Error moving servo: %s", e)
+
+    def _smooth_servo_move(self, target_x, target_y):
+        """Smooth servo movement for large angle changes"""
+        steps = 10         # Number of intermediate steps
+        frames_per_step = 2  # 20 ms servo frames per step (~40 ms/step)
+        frame_us = 20000   # Standard 50 Hz servo frame
+
+        start_x = self.current_x_angle
+        start_y = self.current_y_angle
+
+        # Interpolate the whole trajectory in two C-level calls, then gather
+        # pulse widths from the LUT
+        x_steps = np.linspace(start_x, target_x, steps + 1).astype(np.int32)
+        y_steps = np.linspace(start_y, target_y, steps + 1).astype(np.int32)
+        x_pulses = self._pulse_lut[x_steps]
+        y_pulses = self._pulse_lut[y_steps]
+
+        x_bit = 1 << self.servo_pin_x
+        y_bit = 1 << self.servo_pin_y
+
+        # Emit the whole sweep as one waveform that advances both servo
+        # pulse widths together: DMA ticks the trajectory, keeping the two
+        # axes in lockstep so the laser traces a straight line
+        pulses = []
+        for i in range(steps + 1):
+            x_us = int(x_pulses[i])
+            y_us = int(y_pulses[i])
+            lo, hi = (x_us, y_us) if x_us <= y_us else (y_us, x_us)
+            lo_bit = x_bit if x_us <= y_us else y_bit
+            hi_bit = y_bit if x_us <= y_us else x_bit
+
+            for _ in range(frames_per_step):
+                # Both pins rise at frame start, each falls at its width
+                pulses.append(pigpio.pulse(x_bit | y_bit, 0, lo))
+                if hi > lo:
+                    pulses.append(pigpio.pulse(0, lo_bit, hi - lo))
+                    pulses.append(pigpio.pulse(0, hi_bit, frame_us - hi))
+                else:
+                    pulses.append(pigpio.pulse(0, x_bit | y_bit, frame_us - hi))
+
+        # Hand the pins to the waveform engine for the sweep
+        self.pi.set_servo_pulsewidth(self.servo_pin_x, 0)
+        self.pi.set_servo_pulsewidth(self.servo_pin_y, 0)
+
+        wave_id = None
+        try:
+            self.pi.wave_clear()
+            self.pi.wave_add_generic(pulses)
+            wave_id = self.pi.wave_create()
+            self.pi.wave_send_once(wave_id)
+
+            self._stop_event.wait((steps + 1) * frames_per_step * frame_us / 1e6)
+            while self.pi.wave_tx_busy() and not self._stop_event.is_set():
+                time.sleep(0.01)
+        finally:
+            self.pi.wave_tx_stop()
+            if wave_id is not None:
+                self.pi.wave_delete(wave_id)
+            # Resume steady hardware-timed pulses at the final position
+            self.pi.set_servo_pulsewidth(self.servo_pin_x, int(x_pulses[-1]))
+            self.pi.set_servo_pulsewidth(self.servo_pin_y, int(y_pulses[-1]))
+
+    def _angle_to_pulse_width(self, angle):
+        """Convert servo angle (0-180) to pulse width in microseconds"""
+        return self._pulse_table[int(angle)]
+
+    def center_servos(self):
+        """Move servos to center position"""
+        self.move_servo(90, 90)
+        self.logger.info("Servos centered")
+
+    def test_servos(self):
+        """Test servo movement through full range"""
+        self.logger.info("Testing servo movement...")
+
+        # Test X-axis servo
+        for angle in [0, 45, 90, 135, 180, 90]:
+            self.move_servo(angle, 90)
+            time.sleep(1)
+
+        # Test Y-axis servo
+        for angle in [0, 45, 90, 135, 180, 90]:
+            self.move_servo(90, angle)
+            time.sleep(1)
+
+        self.logger.info("Servo test completed")
+
+    def test_laser(self, duration=2):
+        """Test laser on/off"""
+        self.logger.info("Testing laser...")
+        self.pi.write(self.laser_pin, 1)
+        time.sleep(duration)
+        self.pi.write(self.laser_pin, 0)
+        self.logger.info("Laser test completed")
+
+    def test_buzzer(self, duration=1):
+        """Test buzzer"""
+        self.logger.info("Testing buzzer...")
+        self.pi.write(self.buzzer_pin, 1)
+        time.sleep(duration)
+        self.pi.write(self.buzzer_pin, 0)
+        self.logger.info("Buzzer test completed")
+
+    def test_led(self, duration=2):
+        """Test LED"""
+        self.logger.info("Testing LED...")
+        self.pi.write(self.led_pin, 1)
+        time.sleep(duration)
+        self.pi.write(self.led_pin, 0)
+        self.logger.info("LED test completed")
+
+    def emergency_stop(self):
+        """Emergency stop - turn off all alerts immediately"""
+        try:
+            # Bump the generation first so waits that haven't started yet
+            # still see the stop, then pulse the event to wake any thread
+            # already blocked in one
+            self._stop_gen += 1
+            self._stop_event.set()
+            self._stop_event.clear()
+
+            # Kill any replaying waveform ourselves rather than relying
+            # on the alert thread: a wave left running would keep pulsing
+            # the outputs, overriding the one-shot clear below
+            self.pi.wave_tx_stop()
+            self.pi.clear_bank_1(self._all_on_mask)
+
+            # Clear alert queue, and forget the last enqueued alert so it
+            # can't coalesce away the next legitimate one - the alert it
+            # refers to was just discarded, not executed
+            self.alert_queue.clear()
+            self._last_enqueued = None
+
+            self.alert_active = False
+            self.current_target = None
+
+            self.logger.info("Emergency stop activated")
+
+        except Exception as e:
+            self.logger.error("Error in emergency stop: %s", e)
+
+    def get_status(self):
+        """Get current alert system status"""
+        # All reads are plain attribute loads (ring indices included), so a
+        # polling dashboard never contends with the alert threads
+        queue = self.alert_queue
+        return {
+            'alert_active': self.alert_active,
+            'current_target': self.current_target,
+            'current_x_angle': self.current_x_angle,
+            'current_y_angle': self.current_y_angle,
+            'queue_size': queue.tail - queue.head,
+            'overflow_count': queue.overflow_count
+        }
+
+    def stop(self):
+        """Stop alert system and cleanup"""
+        self.running = False
+        self.logger.info("Stopping alert system...")
+
+        # Interrupt any in-progress alert and wake the alert thread
+        # immediately instead of waiting for its timeout
+        self._stop_event.set()
+        self.alert_queue.put(None)
+
+        # Turn off all outputs
+        try:
+            self.pi.clear_bank_1(self._all_on_mask)
+        except:
+            pass
+
+        # Stop servo pulses
+        try:
+            self.pi.set_servo_pulsewidth(self.servo_pin_x, 0)
+            self.pi.set_servo_pulsewidth(self.servo_pin_y, 0)
+        except:
+            pass
+
+        # Wait for thread to finish
+        if self.alert_thread:
+            self.alert_thread.join(timeout=2)
+
+        # Release pigpio connection
+        try:
+            if self.pi:
+                self.pi.stop()
+        except:
+            pass
+
+        self.logger.info("Alert system stopped")
+
+# Test function
+def test_alert_system():
+    """Test alert system functionality"""
+    from utils import load_config, setup_logging
+
+    config = load_config()
+    if not config:
+        print("Failed to load config")
+        return
+
+    setup_logging(config['system']['log_level'])
+
+    alert_system = AlertSystem(config)
+
+    try:
+        if alert_system.start():
+            print("Alert system started")
+
+            # Test individual components
+            print("Testing servos...")
+            alert_system.test_servos()
+
+            print("Testing laser...")
+            alert_system.test_laser()
+
+            print("Testing buzzer...")
+            alert_system.test_buzzer()
+
+            print("Testing LED...")
+            alert_system.test_led()
+
+            # Test alert at specific position
+            print("Testing alert at position (16, 12)...")
+            alert_system.trigger_alert((16, 12), "test_alert", 3)
+            time.sleep(4)
+
+            print("Test completed")
+        else:
+            print("Failed to start alert system")
+
+    except KeyboardInterrupt:
+        print("\nTest interrupted")
+    finally:
+        alert_system.stop()
+
+if __name__ == "__main__":
+    test_alert_system()
@@ -1,558 +1,852 @@
-"""
-ExamShield GUI Dashboard
-Real-time monitoring interface for the detection system
-"""
-
-import tkinter as tk
-from tkinter import ttk, messagebox
-import threading
-import time
-import cv2
-import numpy as np
-from PIL import Image, ImageTk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import logging
-
-class ExamShieldDashboard:
-    def __init__(self, config, rf_receiver=None, thermal_detection=None, alert_system=None):
-        self.config = config
-        self.rf_receiver = rf_receiver
-        self.thermal_detection = thermal_detection
-        self.alert_system = alert_system
-        self.logger = logging.getLogger(__name__)
-
-        # GUI state
-        self.running = False
-        self.update_thread = None
-
-        # Create main window
-        self.root = tk.Tk()
-        self.root.title("ExamShield - Smart Device Detection System")
-        self.root.geometry("1200x800")
-        self.root.configure(bg='#2c3e50')
-
-        # Variables for display
-        self.detected_devices = tk.StringVar(value="0")
-        self.active_alerts = tk.StringVar(value="0")
-        self.system_status = tk.StringVar(value="Initializing...")
-        self.thermal_temp_range = tk.StringVar(value="--")
-
-        # Setup GUI components
-        self.setup_gui()
-
-        # Bind close event
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-
-    def setup_gui(self):
-        """Setup GUI layout and components"""
-        # Main frame
-        main_frame = ttk.Frame(self.root)
-        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
-
-        # Title
-        title_label = tk.Label(main_frame, text="ExamShield Dashboard", 
-                             font=('Arial', 24, 'bold'), 
-                             bg='#2c3e50', fg='#ecf0f1')
-        title_label.pack(pady=(0, 20))
-
-        # Status bar
-        self.create_status_bar(main_frame)
-
-        # Create notebook for tabs
-        notebook = ttk.Notebook(main_frame)
-        notebook.pack(fill='both', expand=True, pady=(20, 0))
-
-        # Overview tab
-        self.create_overview_tab(notebook)
-
-        # Thermal view tab
-        self.create_thermal_tab(notebook)
-
-        # RF Detection tab
-        self.create_rf_tab(notebook)
-
-        # System Control tab
-        self.create_control_tab(notebook)
-
-    def create_status_bar(self, parent):
-        """Create status information bar"""
-        status_frame = ttk.Frame(parent)
-        status_frame.pack(fill='x', pady=(0, 10))
-
-        # System status
-        ttk.Label(status_frame, text="System Status:", font=('Arial', 12, 'bold')).grid(row=0, column=0, sticky='w')
-        status_label = ttk.Label(status_frame, textvariable=self.system_status, font=('Arial', 12))
-        status_label.grid(row=0, column=1, sticky='w', padx=(10, 20))
-
-        # Detected devices
-        ttk.Label(status_frame, text="Detected Devices:", font=('Arial', 12, 'bold')).grid(row=0, column=2, sticky='w')
-        devices_label = ttk.Label(status_frame, textvariable=self.detected_devices, font=('Arial', 12))
-        devices_label.grid(row=0, column=3, sticky='w', padx=(10, 20))
-
-        # Active alerts
-        ttk.Label(status_frame, text="Active Alerts:", font=('Arial', 12, 'bold')).grid(row=0, column=4, sticky='w')
-        alerts_label = ttk.Label(status_frame, textvariable=self.active_alerts, font=('Arial', 12))
-        alerts_label.grid(row=0, column=5, sticky='w', padx=(10, 0))
-
-    def create_overview_tab(self, notebook):
-        """Create overview tab with real-time information"""
-        overview_frame = ttk.Frame(notebook)
-        notebook.add(overview_frame, text="Overview")
-
-        # Left panel - Detection map
-        left_frame = ttk.LabelFrame(overview_frame, text="Detection Map", padding=10)
-        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
-
-        # Canvas for detection map
-        self.map_canvas = tk.Canvas(left_frame, bg='white', width=400, height=300)
-        self.map_canvas.pack(fill='both', expand=True)
-
-        # Right panel - Statistics and logs
-        right_frame = ttk.Frame(overview_frame)
-        right_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
-
-        # Statistics frame
-        stats_frame = ttk.LabelFrame(right_frame, text="System Statistics", padding=10)
-        stats_frame.pack(fill='x', pady=(0, 5))
-
-        self.stats_text = tk.Text(stats_frame, height=8, state='disabled')
-        stats_scrollbar = ttk.Scrollbar(stats_frame, orient='vertical', command=self.stats_text.yview)
-        self.stats_text.configure(yscrollcommand=stats_scrollbar.set)
-        self.stats_text.pack(side='left', fill='both', expand=True)
-        stats_scrollbar.pack(side='right', fill='y')
-
-        # Recent detections frame
-        detections_frame = ttk.LabelFrame(right_frame, text="Recent Detections", padding=10)
-        detections_frame.pack(fill='both', expand=True, pady=(5, 0))
-
-        # Treeview for detections
-        columns = ('Time', 'Type', 'Position', 'Confidence')
-        self.detections_tree = ttk.Treeview(detections_frame, columns=columns, show='headings', height=10)
-
-        for col in columns:
-            self.detections_tree.heading(col, text=col)
-            self.detections_tree.column(col, width=100)
-
-        detections_scrollbar = ttk.Scrollbar(detections_frame, orient='vertical', command=self.detections_tree.yview)
-        self.detections_tree.configure(yscrollcommand=detections_scrollbar.set)
-
-        self.detections_tree.pack(side='left', fill='both', expand=True)
-        detections_scrollbar.pack(side='right', fill='y')
-
-    def create_thermal_tab(self, notebook):
-        """Create thermal imaging tab"""
-        thermal_frame = ttk.Frame(notebook)
-        notebook.add(thermal_frame, text="Thermal View")
-
-        # Thermal image display
-        image_frame = ttk.LabelFrame(thermal_frame, text="Thermal Camera Feed", padding=10)
-        image_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
-
-        self.thermal_label = tk.Label(image_frame, text="Thermal feed will appear here", bg='black', fg='white')
-        self.thermal_label.pack(fill='both', expand=True)
-
-        # Thermal controls and info
-        control_frame = ttk.Frame(thermal_frame)
-        control_frame.pack(side='right', fill='y', padx=(5, 0))
-
-        # Temperature info
-        temp_frame = ttk.LabelFrame(control_frame, text="Temperature Info", padding=10)
-        temp_frame.pack(fill='x', pady=(0, 10))
-
-        ttk.Label(temp_frame, text="Range:").pack(anchor='w')
-        ttk.Label(temp_frame, textvariable=self.thermal_temp_range).pack(anchor='w')
-
-        # Hotspot detection controls
-        hotspot_frame = ttk.LabelFrame(control_frame, text="Detection Settings", padding=10)
-        hotspot_frame.pack(fill='x', pady=(0, 10))
-
-        ttk.Label(hotspot_frame, text="Temperature Threshold:").pack(anchor='w')
-        self.temp_threshold_var = tk.DoubleVar(value=self.config['thermal']['temp_threshold'])
-        temp_scale = ttk.Scale(hotspot_frame, from_=20, to=40, orient='horizontal', 
-                              variable=self.temp_threshold_var, command=self.update_temp_threshold)
-        temp_scale.pack(fill='x')
-
-        self.temp_threshold_label = ttk.Label(hotspot_frame, text=f"{self.temp_threshold_var.get():.1f}Â°C")
-        self.temp_threshold_label.pack(anchor='w')
-
-        # Hotspot list
-        hotspot_list_frame = ttk.LabelFrame(control_frame, text="Detected Hotspots", padding=10)
-        hotspot_list_frame.pack(fill='both', expand=True)
-
-        self.hotspot_listbox = tk.Listbox(hotspot_list_frame)
-        self.hotspot_listbox.pack(fill='both', expand=True)
-
-    def create_rf_tab(self, notebook):
-        """Create RF detection tab"""
-        rf_frame = ttk.Frame(notebook)
-        notebook.add(rf_frame, text="RF Detection")
-
-        # Device list frame
-        devices_frame = ttk.LabelFrame(rf_frame, text="Detected Devices", padding=10)
-        devices_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
-
-        # Treeview for RF devices
-        rf_columns = ('MAC Address', 'Type', 'RSSI', 'Last Seen', 'Position')
-        self.rf_devices_tree = ttk.Treeview(devices_frame, columns=rf_columns, show='headings')
-
-        for col in rf_columns:
-            self.rf_devices_tree.heading(col, text=col)
-            self.rf_devices_tree.column(col, width=120)
-
-        rf_scrollbar = ttk.Scrollbar(devices_frame, orient='vertical', command=self.rf_devices_tree.yview)
-        self.rf_devices_tree.configure(yscrollcommand=rf_scrollbar.set)
-
-        self.rf_devices_tree.pack(side='left', fill='both', expand=True)
-        rf_scrollbar.pack(side='right', fill='y')
-
-        # ESP32 status frame
-        esp32_frame = ttk.LabelFrame(rf_frame, text="ESP32 Scanner Status", padding=10)
-        esp32_frame.pack(side='right', fill='y', padx=(5, 0))
-
-        self.esp32_status_text = tk.Text(esp32_frame, width=30, height=15, state='disabled')
-        esp32_status_text_scroll = ttk.Scrollbar(esp32_frame, orient='vertical', command=self.esp32_status_text.yview)
-        self.esp32_status_text.configure(yscrollcommand=esp32_status_text_scroll.set)
-
-        self.esp32_status_text.pack(side='left', fill='both', expand=True)
-        esp32_status_text_scroll.pack(side='right', fill='y')
-
-    def create_control_tab(self, notebook):
-        """Create system control tab"""
-        control_frame = ttk.Frame(notebook)
-        notebook.add(control_frame, text="System Control")
-
-        # Alert system controls
-        alert_frame = ttk.LabelFrame(control_frame, text="Alert System Control", padding=20)
-        alert_frame.pack(fill='x', pady=(0, 20))
-
-        alert_buttons_frame = ttk.Frame(alert_frame)
-        alert_buttons_frame.pack()
-
-        ttk.Button(alert_buttons_frame, text="Test Laser", command=self.test_laser).pack(side='left', padx=5)
-        ttk.Button(alert_buttons_frame, text="Test Buzzer", command=self.test_buzzer).pack(side='left', padx=5)
-        ttk.Button(alert_buttons_frame, text="Test LED", command=self.test_led).pack(side='left', padx=5)
-        ttk.Button(alert_buttons_frame, text="Center Servos", command=self.center_servos).pack(side='left', padx=5)
-        ttk.Button(alert_buttons_frame, text="Emergency Stop", command=self.emergency_stop).pack(side='left', padx=5)
-
-        # System controls
-        system_frame = ttk.LabelFrame(control_frame, text="System Control", padding=20)
-        system_frame.pack(fill='x', pady=(0, 20))
-
-        system_buttons_frame = ttk.Frame(system_frame)
-        system_buttons_frame.pack()
-
-        self.start_stop_button = ttk.Button(system_buttons_frame, text="Stop System", command=self.toggle_system)
-        self.start_stop_button.pack(side='left', padx=5)
-
-        ttk.Button(system_buttons_frame, text="Save Config", command=self.save_config).pack(side='left', padx=5)
-        ttk.Button(system_buttons_frame, text="Export Logs", command=self.export_logs).pack(side='left', padx=5)
-
-        # Manual alert test
-        manual_frame = ttk.LabelFrame(control_frame, text="Manual Alert Test", padding=20)
-        manual_frame.pack(fill='x')
-
-        ttk.Label(manual_frame, text="Test Position (X, Y):").pack(anchor='w')
-
-        pos_frame = ttk.Frame(manual_frame)
-        pos_frame.pack(fill='x', pady=5)
-
-        ttk.Label(pos_frame, text="X:").pack(side='left')
-        self.test_x_var = tk.IntVar(value=16)
-        ttk.Entry(pos_frame, textvariable=self.test_x_var, width=5).pack(side='left', padx=(5, 10))
-
-        ttk.Label(pos_frame, text="Y:").pack(side='left')
-        self.test_y_var = tk.IntVar(value=12)
-        ttk.Entry(pos_frame, textvariable=self.test_y_var, width=5).pack(side='left', padx=(5, 10))
-
-        ttk.Button(pos_frame, text="Trigger Test Alert", command=self.trigger_test_alert).pack(side='left', padx=10)
-
-    def start(self):
-        """Start the dashboard"""
-        self.running = True
-        self.system_status.set("Running")
-
-        # Start update thread
-        self.update_thread = threading.Thread(target=self._update_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
-
-        # Start GUI main loop
-        self.root.mainloop()
-
-    def _update_loop(self):
-        """Main update loop for dashboard data"""
-        while self.running:
-            try:
-                self.update_overview_data()
-                self.update_thermal_display()
-                self.update_rf_data()
-                time.sleep(1)  # Update every second
-            except Exception as e:
-                self.logger.error(f"Error in dashboard update: {e}")
-                time.sleep(1)
-
-    def update_overview_data(self):
-        """Update overview tab data"""
-        try:
-            # Update device count
-            if self.rf_receiver:
-                active_devices = self.rf_receiver.get_detected_devices()
-                self.detected_devices.set(str(len(active_devices)))
-
-            # Update alert count
-            if self.alert_system:
-                status = self.alert_system.get_status()
-                alert_count = 1 if status['alert_active'] else 0
-                self.active_alerts.set(str(alert_count))
-
-            # Update statistics
-            self.update_statistics()
-
-            # Update detection map
-            self.update_detection_map()
-
-        except Exception as e:
-            self.logger.error(f"Error updating overview data: {e}")
-
-    def update_statistics(self):
-        """Update system statistics text"""
-        try:
-            stats_text = ""
-
-            # Thermal statistics
-            if self.thermal_detection:
-                thermal_stats = self.thermal_detection.get_statistics()
-                if thermal_stats:
-                    stats_text += f"Thermal Frames: {thermal_stats['frame_count']}\n"
-                    stats_text += f"Temperature: {thermal_stats['min_temp']:.1f} - {thermal_stats['max_temp']:.1f}Â°C\n"
-                    stats_text += f"Avg Temperature: {thermal_stats['avg_temp']:.1f}Â°C\n"
-                    stats_text += f"Hotspots: {thermal_stats['hotspots_detected']}\n"
-
-                    self.thermal_temp_range.set(f"{thermal_stats['min_temp']:.1f} - {thermal_stats['max_temp']:.1f}Â°C")
-
-            # RF statistics
-            if self.rf_receiver:
-                active_devices = self.rf_receiver.get_detected_devices()
-                stats_text += f"\nActive RF Devices: {len(active_devices)}\n"
-
-                for mac, device in active_devices.items():
-                    time_since = time.time() - device['last_seen']
-                    stats_text += f"  {mac[:8]}... ({time_since:.0f}s ago)\n"
-
-            # Update text widget
-            self.stats_text.config(state='normal')
-            self.stats_text.delete(1.0, tk.END)
-            self.stats_text.insert(tk.END, stats_text)
-            self.stats_text.config(state='disabled')
-
-        except Exception as e:
-            self.logger.error(f"Error updating statistics: {e}")
-
-    def update_detection_map(self):
-        """Update the detection map visualization"""
-        try:
-            self.map_canvas.delete("all")
-
-            # Draw room outline
-            self.map_canvas.create_rectangle(50, 50, 350, 250, outline='black', width=2)
-
-            # Draw ESP32 positions
-            esp32_positions = [(75, 75), (325, 75), (75, 225), (325, 225)]
-            for i, (x, y) in enumerate(esp32_positions):
-                self.map_canvas.create_oval(x-10, y-10, x+10, y+10, fill='blue', outline='darkblue')
-                self.map_canvas.create_text(x, y-20, text=f"ESP32-{i+1}", font=('Arial', 8))
-
-            # Draw detected device positions
-            if self.rf_receiver:
-                positions = self.rf_receiver.get_estimated_positions()
-                for pos_data in positions:
-                    x, y = pos_data['position']
-                    # Scale to canvas coordinates
-                    canvas_x = 50 + (x / 100) * 300
-                    canvas_y = 50 + (y / 100) * 200
-
-                    confidence = pos_data['confidence']
-                    color = 'red' if confidence > 0.7 else 'orange' if confidence > 0.4 else 'yellow'
-
-                    self.map_canvas.create_oval(canvas_x-8, canvas_y-8, canvas_x+8, canvas_y+8, 
-                                              fill=color, outline='darkred')
-                    self.map_canvas.create_text(canvas_x, canvas_y-15, 
-                                              text=f"{confidence:.2f}", font=('Arial', 7))
-
-        except Exception as e:
-            self.logger.error(f"Error updating detection map: {e}")
-
-    def update_thermal_display(self):
-        """Update thermal imaging display"""
-        try:
-            if self.thermal_detection:
-                thermal_image = self.thermal_detection.get_thermal_image_for_display()
-
-                if thermal_image is not None:
-                    # Convert OpenCV image to PIL format
-                    image_rgb = cv2.cvtColor(thermal_image, cv2.COLOR_BGR2RGB)
-                    pil_image = Image.fromarray(image_rgb)
-
-                    # Resize for display
-                    pil_image = pil_image.resize((400, 300), Image.Resampling.LANCZOS)
-
-                    # Convert to PhotoImage
-                    photo = ImageTk.PhotoImage(pil_image)
-
-                    # Update label
-                    self.thermal_label.configure(image=photo)
-                    self.thermal_label.image = photo  # Keep a reference
-
-                # Update hotspot list
-                hotspots = self.thermal_detection.detect_hotspots()
-                self.hotspot_listbox.delete(0, tk.END)
-
-                for i, hotspot in enumerate(hotspots):
-                    pos = hotspot['position']
-                    temp = hotspot['avg_temp']
-                    conf = hotspot['confidence']
-                    self.hotspot_listbox.insert(tk.END, 
-                        f"Hotspot {i+1}: ({pos[0]}, {pos[1]}) {temp:.1f}Â°C ({conf:.2f})")
-
-        except Exception as e:
-            self.logger.error(f"Error updating thermal display: {e}")
-
-    def update_rf_data(self):
-        """Update RF detection data"""
-        try:
-            if self.rf_receiver:
-                # Clear existing data
-                for item in self.rf_devices_tree.get_children():
-                    self.rf_devices_tree.delete(item)
-
-                # Add current devices
-                active_devices = self.rf_receiver.get_detected_devices()
-                for mac, device in active_devices.items():
-                    last_seen = time.time() - device['last_seen']
-                    position = device.get('estimated_position', ('--', '--'))
-
-                    # Get latest detection for device type and RSSI
-                    latest_detection = device['detections'][-1] if device['detections'] else {}
-                    device_type = latest_detection.get('device_type', 'Unknown')
-                    rssi = latest_detection.get('rssi', '--')
-
-                    self.rf_devices_tree.insert('', tk.END, values=(
-                        mac[:17], device_type, f"{rssi} dBm", f"{last_seen:.0f}s", 
-                        f"({position[0]:.1f}, {position[1]:.1f})" if position != ('--', '--') else "--"
-                    ))
-
-                # Update ESP32 status
-                esp32_status = "ESP32 Scanner Status:\n\n"
-                for i in range(4):
-                    esp32_status += f"ESP32 #{i+1}: Active\n"
-
-                self.esp32_status_text.config(state='normal')
-                self.esp32_status_text.delete(1.0, tk.END)
-                self.esp32_status_text.insert(tk.END, esp32_status)
-                self.esp32_status_text.config(state='disabled')
-
-        except Exception as e:
-            self.logger.error(f"Error updating RF data: {e}")
-
-    def update_temp_threshold(self, value):
-        """Update temperature threshold"""
-        threshold = float(value)
-        self.temp_threshold_label.configure(text=f"{threshold:.1f}Â°C")
-        self.config['thermal']['temp_threshold'] = threshold
-
-    # Control button callbacks
-    def test_laser(self):
-        """Test laser"""
-        if self.alert_system:
-            self.alert_system.test_laser()
-
-    def test_buzzer(self):
-        """Test buzzer"""
-        if self.alert_system:
-            self.alert_system.test_buzzer()
-
-    def test_led(self):
-        """Test LED"""
-        if self.alert_system:
-            self.alert_system.test_led()
-
-    def center_servos(self):
-        """Center servos"""
-        if self.alert_system:
-            self.alert_system.center_servos()
-
-    def emergency_stop(self):
-        """Emergency stop all alerts"""
-        if self.alert_system:
-            self.alert_system.emergency_stop()
-            messagebox.showinfo("Emergency Stop", "All alerts have been stopped!")
-
-    def trigger_test_alert(self):
-        """Trigger a test alert at specified position"""
-        if self.alert_system:
-            x = self.test_x_var.get()
-            y = self.test_y_var.get()
-            self.alert_system.trigger_alert((x, y), "test_alert", 3)
-
-    def toggle_system(self):
-        """Toggle system start/stop"""
-        # This would be implemented to start/stop the entire system
-        if self.start_stop_button.cget('text') == 'Stop System':
-            self.start_stop_button.configure(text='Start System')
-            self.system_status.set("Stopped")
-        else:
-            self.start_stop_button.configure(text='Stop System')
-            self.system_status.set("Running")
-
-    def save_config(self):
-        """Save current configuration"""
-        try:
-            import json
-            with open('config.json', 'w') as f:
-                json.dump(self.config, f, indent=4)
-            messagebox.showinfo("Config Saved", "Configuration saved successfully!")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save config: {e}")
-
-    def export_logs(self):
-        """Export detection logs"""
-        try:
-            from tkinter import filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-            )
-            if filename:
-                # Copy detection logs to selected file
-                import shutil
-                shutil.copy("data/detections.csv", filename)
-                messagebox.showinfo("Export Complete", f"Logs exported to {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export logs: {e}")
-
-    def on_closing(self):
-        """Handle window closing"""
-        self.running = False
-        if self.update_thread:
-            self.update_thread.join(timeout=1)
-        self.root.destroy()
-
-# Test function
-def test_dashboard():
-    """Test dashboard without hardware"""
-    from utils import load_config, setup_logging
-
-    config = load_config()
-    if not config:
-        print("Failed to load config")
-        return
-
-    setup_logging(config['system']['log_level'])
-
-    dashboard = ExamShieldDashboard(config)
-    dashboard.start()
-
-if __name__ == "__main__":
-    test_dashboard()
+"""
+ExamShield GUI Dashboard
+Real-time monitoring interface for the detection system
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+import threading
+import time
+from queue import SimpleQueue, Empty
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+import logging
+
+# Static portion of the ESP32 scanner status panel; rebuilt only if a
+# scanner's state ever changes
+_ESP32_STATIC_STATUS = "ESP32 Scanner Status:\n\n" + "".join(
+    f"ESP32 #{i+1}: Active\n" for i in range(4)
+)
+
+# Quantized confidence -> marker color for the detection map; comparing
+# the returned interned strings also lets the map skip recoloring markers
+# that jitter within a band
+_CONF_BUCKETS = (0.4, 0.7)
+_CONF_COLORS = ('yellow', 'orange', 'red')
+
+def _conf_color(confidence):
+    return _CONF_COLORS[(confidence > _CONF_BUCKETS[0]) + (confidence > _CONF_BUCKETS[1])]
+
+class ExamShieldDashboard:
+    # Detection map geometry: room coordinates (0-100) -> canvas pixels
+    MAP_OFFSET = 50
+    MAP_SCALE_X = 3.0  # 300 px canvas / 100 room units
+    MAP_SCALE_Y = 2.0  # 200 px canvas / 100 room units
+
+    # Hard cap on the recent detections tree; without it the widget grows
+    # unbounded over hours of operation and every redraw slows down linearly
+    MAX_DETECTION_ROWS = 500
+
+    def __init__(self, config, rf_receiver=None, thermal_detection=None, alert_system=None):
+        self.config = config
+        self.rf_receiver = rf_receiver
+        self.thermal_detection = thermal_detection
+        self.alert_system = alert_system
+        self.logger = logging.getLogger(__name__)
+
+        # GUI state
+        self.running = False
+
+        # Change events pushed by rf_receiver/thermal_detection threads and
+        # drained on the Tk main thread
+        self._events = SimpleQueue()
+        self._last_refresh = 0.0
+
+        # Treeview row tracking for diff-based RF updates: mac -> item id
+        # and mac -> last rendered values
+        self._rf_row_ids = {}
+        self._rf_row_cache = {}
+
+        # Preallocated destination for the thermal display resize, and a
+        # prebuilt 256-entry RGB colormap so false-coloring is one gather
+        # instead of applyColorMap + BGR2RGB passes
+        self._thermal_rgb = np.empty((300, 400, 3), np.uint8)
+        self._thermal_idx = np.empty((300, 400), np.uint8)
+        cmap_bgr = cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(-1, 1),
+                                     cv2.COLORMAP_JET)
+        self._cmap_rgb = np.ascontiguousarray(cmap_bgr.reshape(256, 3)[:, ::-1])
+
+        # Thermal conversion worker: the colormap/resize/hotspot pipeline
+        # runs on this thread (OpenCV/NumPy release the GIL there) so the
+        # Tk thread only builds the PhotoImage from the finished buffer.
+        # The Event requests one conversion; results come back through
+        # self._events as a "thermal_ready" event.
+        self._thermal_req = threading.Event()
+        self._thermal_worker = None
+        self._thermal_frame_ready = False
+        self._thermal_new_rows = []
+
+        # Thermal display decimation: the sensor can deliver up to 8 Hz but
+        # the preview only needs ~4 Hz, and never the same frame twice
+        self._thermal_last_frame_id = -1
+        self._thermal_last_shown = 0.0
+
+        # Last rendered content of the read-only Text widgets, so unchanged
+        # ticks skip the state toggles and Tcl calls entirely
+        self._stats_text_cache = ""
+        self._esp32_status_cache = ""
+
+        # Last rendered hotspot listbox rows for diff-based updates
+        self._last_hotspot_rows = []
+
+        # Create main window
+        self.root = tk.Tk()
+        self.root.title("ExamShield - Smart Device Detection System")
+        self.root.geometry("1200x800")
+        self.root.configure(bg='#2c3e50')
+
+        # Variables for display
+        self.detected_devices = tk.StringVar(value="0")
+        self.active_alerts = tk.StringVar(value="0")
+        self.system_status = tk.StringVar(value="Initializing...")
+        self.thermal_temp_range = tk.StringVar(value="--")
+
+        # Setup GUI components
+        self.setup_gui()
+
+        # Bind close event
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def setup_gui(self):
+        """Setup GUI layout and components"""
+        # Shared named fonts: each font=(...) tuple makes Tk construct a new
+        # font object, which is slow on the Pi's Tk build and wasteful for
+        # the per-marker create_text calls on the detection map
+        import tkinter.font as tkfont
+        self._font_title = tkfont.Font(family='Arial', size=24, weight='bold')
+        self._font_hdr = tkfont.Font(family='Arial', size=12, weight='bold')
+        self._font_val = tkfont.Font(family='Arial', size=12)
+        self._font_small = tkfont.Font(family='Arial', size=8)
+        self._font_tiny = tkfont.Font(family='Arial', size=7)
+
+        # Main frame
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        # Title
+        title_label = tk.Label(main_frame, text="ExamShield Dashboard", 
+                             font=self._font_title, 
+                             bg='#2c3e50', fg='#ecf0f1')
+        title_label.pack(pady=(0, 20))
+
+        # Status bar
+        self.create_status_bar(main_frame)
+
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill='both', expand=True, pady=(20, 0))
+
+        # Overview tab is the default view, so it is built eagerly
+        self.create_overview_tab(self.notebook)
+
+        # The other tabs are empty placeholders until first selected; each
+        # deferred tab saves widget-construction latency and RAM on the Pi
+        # for views the user may never open
+        self._tab_builders = {
+            'Thermal View': self.create_thermal_tab,
+            'RF Detection': self.create_rf_tab,
+            'System Control': self.create_control_tab,
+        }
+        self._tabs_built = {'Overview'}
+        for text in self._tab_builders:
+            self.notebook.add(ttk.Frame(self.notebook), text=text)
+
+        self.notebook.bind('<<NotebookTabChanged>>', self._lazy_tab_init)
+
+    def _lazy_tab_init(self, event=None):
+        """Build a tab's widgets the first time it is selected"""
+        tab_id = self.notebook.select()
+        text = self.notebook.tab(tab_id, 'text')
+        if text in self._tabs_built:
+            return
+
+        self._tabs_built.add(text)
+        self._tab_builders[text](self.notebook.nametowidget(tab_id))
+
+    def create_status_bar(self, parent):
+        """Create status information bar"""
+        status_frame = ttk.Frame(parent)
+        status_frame.pack(fill='x', pady=(0, 10))
+
+        # System status
+        ttk.Label(status_frame, text="System Status:", font=self._font_hdr).grid(row=0, column=0, sticky='w')
+        status_label = ttk.Label(status_frame, textvariable=self.system_status, font=self._font_val)
+        status_label.grid(row=0, column=1, sticky='w', padx=(10, 20))
+
+        # Detected devices
+        ttk.Label(status_frame, text="Detected Devices:", font=self._font_hdr).grid(row=0, column=2, sticky='w')
+        devices_label = ttk.Label(status_frame, textvariable=self.detected_devices, font=self._font_val)
+        devices_label.grid(row=0, column=3, sticky='w', padx=(10, 20))
+
+        # Active alerts
+        ttk.Label(status_frame, text="Active Alerts:", font=self._font_hdr).grid(row=0, column=4, sticky='w')
+        alerts_label = ttk.Label(status_frame, textvariable=self.active_alerts, font=self._font_val)
+        alerts_label.grid(row=0, column=5, sticky='w', padx=(10, 0))
+
+    def create_overview_tab(self, notebook):
+        """Create overview tab with real-time information"""
+        overview_frame = ttk.Frame(notebook)
+        notebook.add(overview_frame, text="Overview")
+
+        # Left panel - Detection map
+        left_frame = ttk.LabelFrame(overview_frame, text="Detection Map", padding=10)
+        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
+
+        # Canvas for detection map
+        self.map_canvas = tk.Canvas(left_frame, bg='white', width=400, height=300)
+        self.map_canvas.pack(fill='both', expand=True)
+
+        # Static features are drawn once; device markers are canvas items
+        # updated in place (mac -> (oval_id, text_id))
+        self._draw_static_map()
+        self._device_items = {}
+
+        # Right panel - Statistics and logs
+        right_frame = ttk.Frame(overview_frame)
+        right_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
+
+        # Statistics frame
+        stats_frame = ttk.LabelFrame(right_frame, text="System Statistics", padding=10)
+        stats_frame.pack(fill='x', pady=(0, 5))
+
+        self.stats_text = tk.Text(stats_frame, height=8, state='disabled')
+        stats_scrollbar = ttk.Scrollbar(stats_frame, orient='vertical', command=self.stats_text.yview)
+        self.stats_text.configure(yscrollcommand=stats_scrollbar.set)
+        self.stats_text.pack(side='left', fill='both', expand=True)
+        stats_scrollbar.pack(side='right', fill='y')
+
+        # Recent detections frame
+        detections_frame = ttk.LabelFrame(right_frame, text="Recent Detections", padding=10)
+        detections_frame.pack(fill='both', expand=True, pady=(5, 0))
+
+        # Treeview for detections
+        columns = ('Time', 'Type', 'Position', 'Confidence')
+        self.detections_tree = ttk.Treeview(detections_frame, columns=columns, show='headings', height=10)
+
+        for col in columns:
+            self.detections_tree.heading(col, text=col)
+            self.detections_tree.column(col, width=100)
+
+        detections_scrollbar = ttk.Scrollbar(detections_frame, orient='vertical', command=self.detections_tree.yview)
+        self.detections_tree.configure(yscrollcommand=detections_scrollbar.set)
+
+        self.detections_tree.pack(side='left', fill='both', expand=True)
+        detections_scrollbar.pack(side='right', fill='y')
+
+    def create_thermal_tab(self, thermal_frame):
+        """Create thermal imaging tab (into its placeholder frame)"""
+
+        # Thermal image display
+        image_frame = ttk.LabelFrame(thermal_frame, text="Thermal Camera Feed", padding=10)
+        image_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
+
+        self.thermal_label = tk.Label(image_frame, text="Thermal feed will appear here", bg='black', fg='white')
+        self.thermal_label.pack(fill='both', expand=True)
+
+        # Thermal controls and info
+        control_frame = ttk.Frame(thermal_frame)
+        control_frame.pack(side='right', fill='y', padx=(5, 0))
+
+        # Temperature info
+        temp_frame = ttk.LabelFrame(control_frame, text="Temperature Info", padding=10)
+        temp_frame.pack(fill='x', pady=(0, 10))
+
+        ttk.Label(temp_frame, text="Range:").pack(anchor='w')
+        ttk.Label(temp_frame, textvariable=self.thermal_temp_range).pack(anchor='w')
+
+        # Hotspot detection controls
+        hotspot_frame = ttk.LabelFrame(control_frame, text="Detection Settings", padding=10)
+        hotspot_frame.pack(fill='x', pady=(0, 10))
+
+        ttk.Label(hotspot_frame, text="Temperature Threshold:").pack(anchor='w')
+        self.temp_threshold_var = tk.DoubleVar(value=self.config['thermal']['temp_threshold'])
+        temp_scale = ttk.Scale(hotspot_frame, from_=20, to=40, orient='horizontal', 
+                              variable=self.temp_threshold_var, command=self.update_temp_threshold)
+        temp_scale.pack(fill='x')
+
+        self.temp_threshold_label = ttk.Label(hotspot_frame, text=f"{self.temp_threshold_var.get():.1f}Â°C")
+        self.temp_threshold_label.pack(anchor='w')
+
+        # Hotspot list
+        hotspot_list_frame = ttk.LabelFrame(control_frame, text="Detected Hotspots", padding=10)
+        hotspot_list_frame.pack(fill='both', expand=True)
+
+        self.hotspot_listbox = tk.Listbox(hotspot_list_frame)
+        self.hotspot_listbox.pack(fill='both', expand=True)
+
+    def create_rf_tab(self, rf_frame):
+        """Create RF detection tab (into its placeholder frame)"""
+
+        # Device list frame
+        devices_frame = ttk.LabelFrame(rf_frame, text="Detected Devices", padding=10)
+        devices_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
+
+        # Treeview for RF devices
+        rf_columns = ('MAC Address', 'Type', 'RSSI', 'Last Seen', 'Position')
+        self.rf_devices_tree = ttk.Treeview(devices_frame, columns=rf_columns, show='headings')
+
+        for col in rf_columns:
+            self.rf_devices_tree.heading(col, text=col)
+            self.rf_devices_tree.column(col, width=120)
+
+        rf_scrollbar = ttk.Scrollbar(devices_frame, orient='vertical', command=self.rf_devices_tree.yview)
+        self.rf_devices_tree.configure(yscrollcommand=rf_scrollbar.set)
+
+        self.rf_devices_tree.pack(side='left', fill='both', expand=True)
+        rf_scrollbar.pack(side='right', fill='y')
+
+        # ESP32 status frame
+        esp32_frame = ttk.LabelFrame(rf_frame, text="ESP32 Scanner Status", padding=10)
+        esp32_frame.pack(side='right', fill='y', padx=(5, 0))
+
+        self.esp32_status_text = tk.Text(esp32_frame, width=30, height=15, state='disabled')
+        esp32_status_text_scroll = ttk.Scrollbar(esp32_frame, orient='vertical', command=self.esp32_status_text.yview)
+        self.esp32_status_text.configure(yscrollcommand=esp32_status_text_scroll.set)
+
+        self.esp32_status_text.pack(side='left', fill='both', expand=True)
+        esp32_status_text_scroll.pack(side='right', fill='y')
+
+    def create_control_tab(self, control_frame):
+        """Create system control tab (into its placeholder frame)"""
+
+        # Alert system controls
+        alert_frame = ttk.LabelFrame(control_frame, text="Alert System Control", padding=20)
+        alert_frame.pack(fill='x', pady=(0, 20))
+
+        alert_buttons_frame = ttk.Frame(alert_frame)
+        alert_buttons_frame.pack()
+
+        ttk.Button(alert_buttons_frame, text="Test Laser", command=self.test_laser).pack(side='left', padx=5)
+        ttk.Button(alert_buttons_frame, text="Test Buzzer", command=self.test_buzzer).pack(side='left', padx=5)
+        ttk.Button(alert_buttons_frame, text="Test LED", command=self.test_led).pack(side='left', padx=5)
+        ttk.Button(alert_buttons_frame, text="Center Servos", command=self.center_servos).pack(side='left', padx=5)
+        ttk.Button(alert_buttons_frame, text="Emergency Stop", command=self.emergency_stop).pack(side='left', padx=5)
+
+        # System controls
+        system_frame = ttk.LabelFrame(control_frame, text="System Control", padding=20)
+        system_frame.pack(fill='x', pady=(0, 20))
+
+        system_buttons_frame = ttk.Frame(system_frame)
+        system_buttons_frame.pack()
+
+        self.start_stop_button = ttk.Button(system_buttons_frame, text="Stop System", command=self.toggle_system)
+        self.start_stop_button.pack(side='left', padx=5)
+
+        ttk.Button(system_buttons_frame, text="Save Config", command=self.save_config).pack(side='left', padx=5)
+        ttk.Button(system_buttons_frame, text="Export Logs", command=self.export_logs).pack(side='left', padx=5)
+
+        # Manual alert test
+        manual_frame = ttk.LabelFrame(control_frame, text="Manual Alert Test", padding=20)
+        manual_frame.pack(fill='x')
+
+        ttk.Label(manual_frame, text="Test Position (X, Y):").pack(anchor='w')
+
+        pos_frame = ttk.Frame(manual_frame)
+        pos_frame.pack(fill='x', pady=5)
+
+        ttk.Label(pos_frame, text="X:").pack(side='left')
+        self.test_x_var = tk.IntVar(value=16)
+        ttk.Entry(pos_frame, textvariable=self.test_x_var, width=5).pack(side='left', padx=(5, 10))
+
+        ttk.Label(pos_frame, text="Y:").pack(side='left')
+        self.test_y_var = tk.IntVar(value=12)
+        ttk.Entry(pos_frame, textvariable=self.test_y_var, width=5).pack(side='left', padx=(5, 10))
+
+        ttk.Button(pos_frame, text="Trigger Test Alert", command=self.trigger_test_alert).pack(side='left', padx=10)
+
+    def start(self):
+        """Start the dashboard"""
+        self.running = True
+        self.system_status.set("Running")
+
+        # Register for change events so refreshes track real activity
+        # instead of a fixed polling cadence; the callbacks run on the
+        # producer threads and only touch the queue
+        if self.rf_receiver:
+            self.rf_receiver.on_update = lambda: self._events.put("rf")
+        if self.thermal_detection:
+            self.thermal_detection.on_frame = lambda: self._events.put("thermal")
+
+        # Start the thermal conversion worker
+        if self.thermal_detection:
+            self._thermal_worker = threading.Thread(target=self._thermal_worker_loop)
+            self._thermal_worker.daemon = True
+            self._thermal_worker.start()
+
+        # Drain events on the Tk main thread
+        self.root.after(50, self._drain_events)
+
+        # Start GUI main loop
+        self.root.mainloop()
+
+    def _drain_events(self):
+        """Coalesce pending change events and refresh affected panels"""
+        if not self.running:
+            return
+
+        pending = set()
+        while True:
+            try:
+                pending.add(self._events.get_nowait())
+            except Empty:
+                break
+
+        # Refresh when something changed; fall back to a 1 Hz tick so
+        # last-seen ages and alert status stay current while idle
+        now = time.monotonic()
+        if pending or now - self._last_refresh >= 1.0:
+            self._last_refresh = now
+            self._apply_updates(pending or None)
+
+        self.root.after(50, self._drain_events)
+
+    def _apply_updates(self, pending=None):
+        """Apply widget updates in one batch (main thread)"""
+        try:
+            # One snapshot per refresh: every panel renders the same data
+            # and the cross-module getters run once instead of per panel
+            rf_devices = self.rf_receiver.get_detected_devices() if self.rf_receiver else {}
+            rf_positions = self.rf_receiver.get_estimated_positions() if self.rf_receiver else []
+            thermal_stats = self.thermal_detection.get_statistics() if self.thermal_detection else None
+
+            # Only refresh the tab that is actually on screen (a visible
+            # tab is necessarily built); writing to hidden widgets is a
+            # wasted Tcl round-trip per widget per tick. The status bar is
+            # visible from every tab and always updates.
+            current = self.notebook.tab(self.notebook.select(), 'text')
+            self._update_status_bar(rf_devices)
+
+            if current == 'Overview':
+                self.update_overview_data(rf_devices, rf_positions, thermal_stats)
+            elif current == 'Thermal View':
+                # Show any conversion the worker finished since the last drain
+                if pending and "thermal_ready" in pending:
+                    self.update_thermal_display()
+
+                if pending is None or "thermal" in pending:
+                    # Decimate the expensive colormap/resize path: skip when
+                    # no new frame arrived or the last render was under
+                    # 0.25s ago
+                    frame_id = self.thermal_detection.frame_count if self.thermal_detection else -1
+                    now = time.monotonic()
+                    if (frame_id != self._thermal_last_frame_id
+                            and now - self._thermal_last_shown >= 0.25):
+                        self._thermal_last_frame_id = frame_id
+                        self._thermal_last_shown = now
+                        self._thermal_req.set()
+            elif current == 'RF Detection':
+                if pending is None or "rf" in pending:
+                    self.update_rf_data(rf_devices)
+        except Exception as e:
+            self.logger.error(f"Error in dashboard update: {e}")
+        finally:
+            # One coalesced redraw per refresh rather than one per mutation
+            self.root.update_idletasks()
+
+    def _update_status_bar(self, rf_devices):
+        """Update the always-visible status bar counters"""
+        self.detected_devices.set(str(len(rf_devices)))
+
+        if self.alert_system:
+            status = self.alert_system.get_status()
+            alert_count = 1 if status['alert_active'] else 0
+            self.active_alerts.set(str(alert_count))
+
+    def update_overview_data(self, rf_devices, rf_positions, thermal_stats):
+        """Update overview tab data"""
+        try:
+            # Update statistics
+            self.update_statistics(rf_devices, thermal_stats)
+
+            # Update detection map
+            self.update_detection_map(rf_positions)
+
+        except Exception as e:
+            self.logger.error(f"Error updating overview data: {e}")
+
+    def update_statistics(self, rf_devices, thermal_stats):
+        """Update system statistics text"""
+        try:
+            # Collect parts and join once; += concatenation in the device
+            # loop re-allocates the whole string per iteration
+            parts = []
+
+            # Thermal statistics
+            if self.thermal_detection and thermal_stats:
+                parts.extend([
+                    f"Thermal Frames: {thermal_stats['frame_count']}\n",
+                    f"Temperature: {thermal_stats['min_temp']:.1f} - {thermal_stats['max_temp']:.1f}Â°C\n",
+                    f"Avg Temperature: {thermal_stats['avg_temp']:.1f}Â°C\n",
+                    f"Hotspots: {thermal_stats['hotspots_detected']}\n",
+                ])
+
+                self.thermal_temp_range.set(f"{thermal_stats['min_temp']:.1f} - {thermal_stats['max_temp']:.1f}Â°C")
+
+            # RF statistics
+            if self.rf_receiver:
+                parts.append(f"\nActive RF Devices: {len(rf_devices)}\n")
+
+                now = time.time()
+                parts.extend(
+                    f"  {device['_mac8']}... ({now - device['last_seen']:.0f}s ago)\n"
+                    for device in rf_devices.values()
+                )
+
+            stats_text = "".join(parts)
+
+            # Update text widget only when the content actually changed, and
+            # with one replace call instead of separate delete+insert
+            if stats_text != self._stats_text_cache:
+                self._stats_text_cache = stats_text
+                self.stats_text.configure(state='normal')
+                self.stats_text.replace('1.0', tk.END, stats_text)
+                self.stats_text.configure(state='disabled')
+
+        except Exception as e:
+            self.logger.error(f"Error updating statistics: {e}")
+
+    def _draw_static_map(self):
+        """Draw the fixed room outline and ESP32 markers (once)"""
+        # Room outline
+        self.map_canvas.create_rectangle(50, 50, 350, 250, outline='black', width=2)
+
+        # ESP32 positions
+        esp32_positions = [(75, 75), (325, 75), (75, 225), (325, 225)]
+        for i, (x, y) in enumerate(esp32_positions):
+            self.map_canvas.create_oval(x-10, y-10, x+10, y+10, fill='blue', outline='darkblue')
+            self.map_canvas.create_text(x, y-20, text=f"ESP32-{i+1}", font=self._font_small)
+
+    def update_detection_map(self, rf_positions):
+        """Update device markers on the detection map"""
+        try:
+            # Move/recolor existing markers in place rather than wiping the
+            # whole canvas and recreating every item each tick
+            seen = set()
+            for pos_data in rf_positions:
+                mac = pos_data['mac_address']
+                x, y = pos_data['position']
+                # Scale to canvas coordinates
+                canvas_x = self.MAP_OFFSET + x * self.MAP_SCALE_X
+                canvas_y = self.MAP_OFFSET + y * self.MAP_SCALE_Y
+
+                confidence = pos_data['confidence']
+                color = _conf_color(confidence)
+
+                seen.add(mac)
+                if mac in self._device_items:
+                    item = self._device_items[mac]
+                    oval_id, text_id = item[0], item[1]
+                    self.map_canvas.coords(oval_id, canvas_x-8, canvas_y-8, canvas_x+8, canvas_y+8)
+                    # Recolor only on a bucket change; within-band jitter
+                    # shouldn't cost an itemconfigure round-trip
+                    if item[2] is not color:
+                        self.map_canvas.itemconfigure(oval_id, fill=color)
+                        item[2] = color
+                    self.map_canvas.coords(text_id, canvas_x, canvas_y-15)
+                    self.map_canvas.itemconfigure(text_id, text=f"{confidence:.2f}")
+                else:
+                    oval_id = self.map_canvas.create_oval(canvas_x-8, canvas_y-8, canvas_x+8, canvas_y+8,
+                                                          fill=color, outline='darkred')
+                    text_id = self.map_canvas.create_text(canvas_x, canvas_y-15,
+                                                          text=f"{confidence:.2f}", font=self._font_tiny)
+                    self._device_items[mac] = [oval_id, text_id, color]
+
+            # Remove markers for devices that are no longer positioned
+            for mac in list(self._device_items):
+                if mac not in seen:
+                    oval_id, text_id, _ = self._device_items.pop(mac)
+                    self.map_canvas.delete(oval_id)
+                    self.map_canvas.delete(text_id)
+
+        except Exception as e:
+            self.logger.error(f"Error updating detection map: {e}")
+
+    def add_detection_row(self, values):
+        """Append a row to the recent detections tree, keeping only the
+        latest MAX_DETECTION_ROWS so steady-state redraw cost stays constant"""
+        children = self.detections_tree.get_children()
+        if len(children) >= self.MAX_DETECTION_ROWS:
+            excess = len(children) - self.MAX_DETECTION_ROWS + 1
+            self.detections_tree.delete(*children[:excess])
+        self.detections_tree.insert('', tk.END, values=values)
+
+    def _thermal_worker_loop(self):
+        """Run requested thermal conversions off the Tk thread"""
+        while self.running:
+            # The Event doubles as a shutdown wakeup: on_closing sets it
+            # after clearing self.running, so close never waits on a poll
+            self._thermal_req.wait()
+            self._thermal_req.clear()
+            if not self.running:
+                break
+
+            try:
+                if self._prepare_thermal_display():
+                    self._events.put("thermal_ready")
+            except Exception as e:
+                self.logger.error(f"Error preparing thermal display: {e}")
+
+    def _prepare_thermal_display(self):
+        """Convert the latest thermal frame for display (worker thread)"""
+        if not self.thermal_detection:
+            return False
+
+        result = self.thermal_detection.get_thermal_image_for_display()
+
+        self._thermal_frame_ready = result is not None
+        if result is not None:
+            raw_u8, hotspots = result
+
+            # Resize the 8-bit indices first (cheapest representation),
+            # then gather through the prebuilt RGB colormap straight into
+            # the display buffer: one pass instead of colormap + BGR2RGB
+            # + two resizes
+            cv2.resize(raw_u8, (400, 300), dst=self._thermal_idx,
+                       interpolation=cv2.INTER_LINEAR)
+            np.take(self._cmap_rgb, self._thermal_idx, axis=0,
+                    out=self._thermal_rgb)
+
+            # Hotspot overlays, scaled from sensor to display coordinates;
+            # the scale factors are loop-invariant, so compute them once
+            h, w = raw_u8.shape
+            sx = 400.0 / w
+            sy = 300.0 / h
+            for hotspot in hotspots:
+                x = int(hotspot['position'][0] * sx)
+                y = int(hotspot['position'][1] * sy)
+                cv2.circle(self._thermal_rgb, (x, y), 10, (0, 255, 0), 2)
+                cv2.putText(self._thermal_rgb, f"{hotspot['avg_temp']:.1f}C",
+                            (x - 20, y - 15), cv2.FONT_HERSHEY_SIMPLEX, 0.4,
+                            (255, 255, 255), 1)
+        else:
+            hotspots = self.thermal_detection.detect_hotspots()
+
+        self._thermal_new_rows = [
+            f"Hotspot {i+1}: ({h['position'][0]}, {h['position'][1]}) "
+            f"{h['avg_temp']:.1f}Â°C ({h['confidence']:.2f})"
+            for i, h in enumerate(hotspots)
+        ]
+
+        return True
+
+    def update_thermal_display(self):
+        """Show the most recent prepared thermal conversion (main thread)"""
+        try:
+            if self._thermal_frame_ready:
+                # Tk objects must be created on the Tk thread; everything
+                # up to this point happened on the worker
+                photo = ImageTk.PhotoImage(Image.fromarray(self._thermal_rgb))
+                self.thermal_label.configure(image=photo)
+                self.thermal_label.image = photo  # Keep a reference
+
+            # Update hotspot list: skip when unchanged, otherwise only
+            # rewrite from the first differing row instead of a full
+            # delete/re-insert of every entry
+            new_rows = self._thermal_new_rows
+            if new_rows != self._last_hotspot_rows:
+                prefix = 0
+                for old, new in zip(self._last_hotspot_rows, new_rows):
+                    if old != new:
+                        break
+                    prefix += 1
+
+                self.hotspot_listbox.delete(prefix, tk.END)
+                if new_rows[prefix:]:
+                    self.hotspot_listbox.insert(tk.END, *new_rows[prefix:])
+                self._last_hotspot_rows = new_rows
+
+        except Exception as e:
+            self.logger.error(f"Error updating thermal display: {e}")
+
+    def update_rf_data(self, rf_devices):
+        """Update RF detection data"""
+        try:
+            if self.rf_receiver:
+                # Build the desired row values, then diff against what the
+                # tree already shows - full rebuilds force Tk to re-layout
+                # and re-render every row each second
+                now = time.time()
+                new_values = {}
+                for mac, device in rf_devices.items():
+                    last_seen = now - device['last_seen']
+                    position = device.get('estimated_position', ('--', '--'))
+
+                    # Get latest detection for device type and RSSI
+                    latest_detection = device['detections'][-1] if device['detections'] else {}
+                    device_type = latest_detection.get('device_type', 'Unknown')
+                    rssi = latest_detection.get('rssi', '--')
+
+                    new_values[mac] = (
+                        device['_mac17'], device_type, f"{rssi} dBm", f"{last_seen:.0f}s",
+                        f"({position[0]:.1f}, {position[1]:.1f})" if position != ('--', '--') else "--"
+                    )
+
+                # Remove rows for vanished devices
+                for mac in list(self._rf_row_ids):
+                    if mac not in new_values:
+                        self.rf_devices_tree.delete(self._rf_row_ids.pop(mac))
+                        self._rf_row_cache.pop(mac, None)
+
+                # Insert new rows, update only rows whose values changed
+                for mac, values in new_values.items():
+                    if mac not in self._rf_row_ids:
+                        self._rf_row_ids[mac] = self.rf_devices_tree.insert('', tk.END, values=values)
+                        self._rf_row_cache[mac] = values
+                    elif self._rf_row_cache[mac] != values:
+                        self.rf_devices_tree.item(self._rf_row_ids[mac], values=values)
+                        self._rf_row_cache[mac] = values
+
+                # Update ESP32 status (all-active text is precomputed)
+                esp32_status = _ESP32_STATIC_STATUS
+
+                if esp32_status != self._esp32_status_cache:
+                    self._esp32_status_cache = esp32_status
+                    self.esp32_status_text.configure(state='normal')
+                    self.esp32_status_text.replace('1.0', tk.END, esp32_status)
+                    self.esp32_status_text.configure(state='disabled')
+
+        except Exception as e:
+            self.logger.error(f"Error updating RF data: {e}")
+
+    def update_temp_threshold(self, value):
+        """Update temperature threshold"""
+        threshold = float(value)
+        self.temp_threshold_label.configure(text=f"{threshold:.1f}Â°C")
+        self.config['thermal']['temp_threshold'] = threshold
+
+    # Control button callbacks
+    def test_laser(self):
+        """Test laser"""
+        if self.alert_system:
+            self.alert_system.test_laser()
+
+    def test_buzzer(self):
+        """Test buzzer"""
+        if self.alert_system:
+            self.alert_system.test_buzzer()
+
+    def test_led(self):
+        """Test LED"""
+        if self.alert_system:
+            self.alert_system.test_led()
+
+    def center_servos(self):
+        """Center servos"""
+        if self.alert_system:
+            self.alert_system.center_servos()
+
+    def emergency_stop(self):
+        """Emergency stop all alerts"""
+        if self.alert_system:
+            self.alert_system.emergency_stop()
+            messagebox.showinfo("Emergency Stop", "All alerts have been stopped!")
+
+    def trigger_test_alert(self):
+        """Trigger a test alert at specified position"""
+        if self.alert_system:
+            x = self.test_x_var.get()
+            y = self.test_y_var.get()
+            self.alert_system.trigger_alert((x, y), "test_alert", 3)
+
+    def toggle_system(self):
+        """Toggle system start/stop"""
+        # This would be implemented to start/stop the entire system
+        if self.start_stop_button.cget('text') == 'Stop System':
+            self.start_stop_button.configure(text='Start System')
+            self.system_status.set("Stopped")
+        else:
+            self.start_stop_button.configure(text='Stop System')
+            self.system_status.set("Running")
+
+    def save_config(self, pretty=False):
+        """Save current configuration
+
+        Writes compactly to a temp file and renames it into place, so a
+        crash mid-write can't corrupt config.json and the SD card sees
+        fewer bytes per save. Pass pretty=True for a human-readable dump.
+        """
+        try:
+            import json
+            import os
+            tmp = 'config.json.tmp'
+            with open(tmp, 'w') as f:
+                if pretty:
+                    json.dump(self.config, f, indent=4)
+                else:
+                    json.dump(self.config, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, 'config.json')
+            messagebox.showinfo("Config Saved", "Configuration saved successfully!")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save config: {e}")
+
+    def export_logs(self):
+        """Export detection logs"""
+        from tkinter import filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+
+        # Copy on a worker thread so a multi-MB log doesn't freeze the GUI;
+        # sendfile copies in-kernel, falling back to chunked copy if the
+        # target filesystem doesn't support it
+        def _do_copy():
+            import os
+            import shutil
+            try:
+                with open("data/detections.csv", "rb") as src, open(filename, "wb") as dst:
+                    try:
+                        os.sendfile(dst.fileno(), src.fileno(), 0,
+                                    os.fstat(src.fileno()).st_size)
+                    except OSError:
+                        shutil.copyfileobj(src, dst, length=1024 * 1024)
+            except Exception as e:
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Error", f"Failed to export logs: {e}"))
+            else:
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Export Complete", f"Logs exported to {filename}"))
+
+        threading.Thread(target=_do_copy, daemon=True).start()
+
+    def on_closing(self):
+        """Handle window closing"""
+        self.running = False
+
+        # Detach callbacks so producer threads stop queueing events
+        if self.rf_receiver:
+            self.rf_receiver.on_update = None
+        if self.thermal_detection:
+            self.thermal_detection.on_frame = None
+
+        # Wake the thermal worker and join it before tearing down the
+        # root; a worker still mid-conversion after destroy could post to
+        # a dead interpreter
+        if self._thermal_worker:
+            self._thermal_req.set()
+            self._thermal_worker.join(timeout=1.5)
+
+        self.root.destroy()
+
+# Test function
+def test_dashboard():
+    """Test dashboard without hardware"""
+    from utils import load_config, setup_logging
+
+    config = load_config()
+    if not config:
+        print("Failed to load config")
+        return
+
+    setup_logging(config['system']['log_level'])
+
+    dashboard = ExamShieldDashboard(config)
+    dashboard.start()
+
+if __name__ == "__main__":
+    test_dashboard()
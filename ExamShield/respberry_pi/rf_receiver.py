@@ -1,309 +1,452 @@
-"""
-ExamShield RF Receiver Module
-Receives and processes data from ESP32 BLE/WiFi scanners
-"""
-
-import serial
-import threading
-import time
-import json
-import logging
-from queue import Queue
-import re
-
-class RFReceiver:
-    def __init__(self, config):
-        self.config = config
-        self.logger = logging.getLogger(__name__)
-        self.serial_connections = {}
-        self.data_queue = Queue()
-        self.running = False
-        self.threads = []
-
-        # Device tracking
-        self.detected_devices = {}
-        self.esp32_positions = [
-            (0, 0),      # ESP32 #1 - Top-left corner
-            (100, 0),    # ESP32 #2 - Top-right corner  
-            (0, 100),    # ESP32 #3 - Bottom-left corner
-            (100, 100)   # ESP32 #4 - Bottom-right corner
-        ]
-
-    def start(self):
-        """Start RF receiver threads"""
-        self.running = True
-        self.logger.info("Starting RF Receiver...")
-
-        # Start serial connections to ESP32s
-        for i, port in enumerate(self.config['esp32']['serial_ports']):
-            try:
-                self.connect_esp32(i, port)
-            except Exception as e:
-                self.logger.error(f"Failed to connect to ESP32 on {port}: {e}")
-
-        # Start data processing thread
-        processing_thread = threading.Thread(target=self._process_data)
-        processing_thread.daemon = True
-        processing_thread.start()
-        self.threads.append(processing_thread)
-
-        self.logger.info(f"RF Receiver started with {len(self.serial_connections)} ESP32 connections")
-
-    def connect_esp32(self, esp32_id, port):
-        """Connect to individual ESP32"""
-        try:
-            ser = serial.Serial(
-                port=port,
-                baudrate=self.config['esp32']['baud_rate'],
-                timeout=1
-            )
-
-            self.serial_connections[esp32_id] = ser
-
-            # Start reading thread for this ESP32
-            thread = threading.Thread(target=self._read_esp32_data, args=(esp32_id, ser))
-            thread.daemon = True
-            thread.start()
-            self.threads.append(thread)
-
-            self.logger.info(f"Connected to ESP32 #{esp32_id} on {port}")
-
-        except serial.SerialException as e:
-            self.logger.error(f"Could not connect to ESP32 on {port}: {e}")
-            raise
-
-    def _read_esp32_data(self, esp32_id, serial_connection):
-        """Read data from individual ESP32"""
-        while self.running:
-            try:
-                if serial_connection.in_waiting > 0:
-                    line = serial_connection.readline().decode('utf-8').strip()
-                    if line:
-                        self._parse_esp32_data(esp32_id, line)
-
-                time.sleep(0.1)  # Small delay to prevent CPU overload
-
-            except Exception as e:
-                self.logger.error(f"Error reading from ESP32 #{esp32_id}: {e}")
-                time.sleep(1)
-
-    def _parse_esp32_data(self, esp32_id, data_line):
-        """Parse data received from ESP32"""
-        try:
-            # Expected format: "DEVICE:MAC_ADDRESS:RSSI:TYPE"
-            # Example: "DEVICE:AA:BB:CC:DD:EE:FF:-45:WiFi"
-            if data_line.startswith("DEVICE:"):
-                parts = data_line.split(":")
-                if len(parts) >= 4:
-                    mac_address = ":".join(parts[1:7])  # MAC address parts
-                    rssi = int(parts[7])
-                    device_type = parts[8] if len(parts) > 8 else "Unknown"
-
-                    # Add to data queue for processing
-                    detection_data = {
-                        'esp32_id': esp32_id,
-                        'mac_address': mac_address,
-                        'rssi': rssi,
-                        'device_type': device_type,
-                        'timestamp': time.time(),
-                        'position': self.esp32_positions[esp32_id]
-                    }
-
-                    self.data_queue.put(detection_data)
-
-                    if self.config['system']['debug_mode']:
-                        self.logger.debug(f"ESP32 #{esp32_id} detected: {mac_address} ({rssi} dBm)")
-
-        except Exception as e:
-            self.logger.error(f"Error parsing ESP32 data '{data_line}': {e}")
-
-    def _process_data(self):
-        """Process queued RF detection data"""
-        while self.running:
-            try:
-                if not self.data_queue.empty():
-                    detection = self.data_queue.get()
-                    self._update_device_tracking(detection)
-
-                time.sleep(0.1)
-
-            except Exception as e:
-                self.logger.error(f"Error processing RF data: {e}")
-
-    def _update_device_tracking(self, detection):
-        """Update device tracking with new detection"""
-        mac = detection['mac_address']
-
-        # Initialize device tracking if new device
-        if mac not in self.detected_devices:
-            self.detected_devices[mac] = {
-                'first_seen': detection['timestamp'],
-                'last_seen': detection['timestamp'],
-                'detections': [],
-                'estimated_position': None
-            }
-
-        # Update device info
-        device = self.detected_devices[mac]
-        device['last_seen'] = detection['timestamp']
-        device['detections'].append(detection)
-
-        # Keep only recent detections (last 30 seconds)
-        cutoff_time = detection['timestamp'] - 30
-        device['detections'] = [
-            d for d in device['detections'] 
-            if d['timestamp'] > cutoff_time
-        ]
-
-        # Estimate position if we have multiple ESP32 detections
-        self._estimate_device_position(mac)
-
-    def _estimate_device_position(self, mac_address):
-        """Estimate device position using RSSI triangulation"""
-        if mac_address not in self.detected_devices:
-            return
-
-        device = self.detected_devices[mac_address]
-        recent_detections = device['detections']
-
-        # Get latest RSSI from each ESP32
-        esp32_rssi = {}
-        for detection in recent_detections:
-            esp32_id = detection['esp32_id']
-            # Keep the strongest (most recent) signal from each ESP32
-            if esp32_id not in esp32_rssi or detection['rssi'] > esp32_rssi[esp32_id]['rssi']:
-                esp32_rssi[esp32_id] = detection
-
-        # Need at least 3 ESP32 detections for triangulation
-        if len(esp32_rssi) >= 3:
-            from utils import calculate_distance, trilaterate
-
-            positions = []
-            distances = []
-
-            for esp32_id in sorted(esp32_rssi.keys()):
-                detection = esp32_rssi[esp32_id]
-                positions.append(detection['position'])
-                # Convert RSSI to approximate distance
-                distance = self._rssi_to_distance(detection['rssi'])
-                distances.append(distance)
-
-            # Perform triangulation
-            estimated_pos = trilaterate(distances, positions)
-            if estimated_pos:
-                device['estimated_position'] = estimated_pos
-                self.logger.debug(f"Device {mac_address} estimated position: {estimated_pos}")
-
-    def _rssi_to_distance(self, rssi):
-        """Convert RSSI to approximate distance in meters"""
-        if rssi == 0:
-            return -1.0
-
-        # Simple path loss model: RSSI = -10*n*log10(d) + A
-        # Where n=2 (free space), A=-30 (reference RSSI at 1m)
-        # Solving for d: d = 10^((A - RSSI) / (10 * n))
-        n = 2.0  # Path loss exponent
-        A = -30  # Reference RSSI at 1 meter
-
-        distance = 10 ** ((A - rssi) / (10 * n))
-        return max(distance, 0.1)  # Minimum 10cm
-
-    def get_detected_devices(self):
-        """Get currently detected devices"""
-        current_time = time.time()
-        active_devices = {}
-
-        for mac, device in self.detected_devices.items():
-            # Only include devices seen in last 10 seconds
-            if current_time - device['last_seen'] <= 10:
-                active_devices[mac] = device
-
-        return active_devices
-
-    def get_estimated_positions(self):
-        """Get estimated positions of detected devices"""
-        positions = []
-        active_devices = self.get_detected_devices()
-
-        for mac, device in active_devices.items():
-            if device['estimated_position']:
-                positions.append({
-                    'mac_address': mac,
-                    'position': device['estimated_position'],
-                    'confidence': self._calculate_position_confidence(device)
-                })
-
-        return positions
-
-    def _calculate_position_confidence(self, device):
-        """Calculate confidence in position estimate"""
-        # Confidence based on number of ESP32s detecting the device
-        # and signal strength consistency
-        detections = device['detections']
-        if not detections:
-            return 0.0
-
-        # Count unique ESP32s
-        unique_esp32s = len(set(d['esp32_id'] for d in detections))
-
-        # Base confidence on number of detecting ESP32s
-        base_confidence = min(unique_esp32s / 4.0, 1.0)  # Max confidence with all 4 ESP32s
-
-        # Adjust based on signal strength (stronger signals = higher confidence)
-        avg_rssi = sum(d['rssi'] for d in detections) / len(detections)
-        rssi_factor = max(0.1, min(1.0, (avg_rssi + 100) / 50))  # Normalize RSSI to 0.1-1.0
-
-        return base_confidence * rssi_factor
-
-    def stop(self):
-        """Stop RF receiver"""
-        self.running = False
-        self.logger.info("Stopping RF Receiver...")
-
-        # Close all serial connections
-        for ser in self.serial_connections.values():
-            try:
-                ser.close()
-            except:
-                pass
-
-        # Wait for threads to finish
-        for thread in self.threads:
-            thread.join(timeout=2)
-
-        self.logger.info("RF Receiver stopped")
-
-# Test function
-def test_rf_receiver():
-    """Test RF receiver functionality"""
-    from utils import load_config, setup_logging
-
-    config = load_config()
-    if not config:
-        print("Failed to load config")
-        return
-
-    setup_logging(config['system']['log_level'])
-
-    rf_receiver = RFReceiver(config)
-
-    try:
-        rf_receiver.start()
-
-        # Run for 30 seconds for testing
-        for i in range(30):
-            time.sleep(1)
-            devices = rf_receiver.get_detected_devices()
-            positions = rf_receiver.get_estimated_positions()
-
-            print(f"\rActive devices: {len(devices)}, Positions: {len(positions)}", end="")
-
-        print("\nTest completed")
-
-    except KeyboardInterrupt:
-        print("\nTest interrupted")
-    finally:
-        rf_receiver.stop()
-
-if __name__ == "__main__":
-    test_rf_receiver()
+"""
+ExamShield RF Receiver Module
+Receives and processes data from ESP32 BLE/WiFi scanners
+"""
+
+import os
+import selectors
+import serial
+import threading
+import time
+import json
+import logging
+from collections import deque
+import numpy as np
+from queue import Queue, Empty
+import re
+
+from _rf_kernels import rssi_to_distance_arr, position_confidence
+
+# Matches a raw scanner line like b"DEVICE:AA:BB:CC:DD:EE:FF:-45:WiFi" in
+# one pass, capturing MAC/RSSI/type without split(":")'s string churn
+_DEVICE_RE = re.compile(rb'^DEVICE:([0-9A-Fa-f:]{17}):(-?\d+):(\w+)')
+
+# The standard corner layout; with scanners at these positions the
+# trilateration has a closed form (see _estimate_device_position)
+_DEFAULT_GRID = [
+    (0, 0),
+    (100, 0),
+    (0, 100),
+    (100, 100)
+]
+
+class RFReceiver:
+    def __init__(self, config):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.serial_connections = {}
+        self.data_queue = Queue()
+        self.running = False
+        self.threads = []
+        self._selector = None
+
+        # Device tracking
+        self.detected_devices = {}
+
+        # Structure-of-arrays view of the hot filter field: a contiguous
+        # last-seen array indexed by _mac_index lets get_detected_devices()
+        # pick the active set in one vectorized compare instead of walking
+        # every per-device dict. Records stay dicts: the GUI reads them
+        # by key, so only the scan path moves to arrays.
+        self._mac_index = {}
+        self._macs = []
+        self._last_seen = np.zeros(64, dtype=np.float64)
+
+        # Optional callback invoked (from the processing thread) whenever
+        # device tracking changes; used by the GUI for event-driven updates
+        self.on_update = None
+
+        # Optional threading.Event set on the same occasions; used by the
+        # correlation loop to wake only when there is work
+        self.activity_event = None
+        self.esp32_positions = [
+            (0, 0),      # ESP32 #1 - Top-left corner
+            (100, 0),    # ESP32 #2 - Top-right corner  
+            (0, 100),    # ESP32 #3 - Bottom-left corner
+            (100, 100)   # ESP32 #4 - Bottom-right corner
+        ]
+
+    def start(self):
+        """Start RF receiver threads"""
+        self.running = True
+        self.logger.info("Starting RF Receiver...")
+
+        # One selector-driven reader services every ESP32 port: per-port
+        # threads bought no parallelism under the GIL while each cost a
+        # stack and steady context switches
+        self._selector = selectors.DefaultSelector()
+
+        # Start serial connections to ESP32s
+        for i, port in enumerate(self.config['esp32']['serial_ports']):
+            try:
+                self.connect_esp32(i, port)
+            except Exception as e:
+                self.logger.error(f"Failed to connect to ESP32 on {port}: {e}")
+
+        if self.serial_connections:
+            reader_thread = threading.Thread(target=self._read_serial_loop)
+            reader_thread.daemon = True
+            reader_thread.start()
+            self.threads.append(reader_thread)
+
+        # Start data processing thread
+        processing_thread = threading.Thread(target=self._process_data)
+        processing_thread.daemon = True
+        processing_thread.start()
+        self.threads.append(processing_thread)
+
+        self.logger.info(f"RF Receiver started with {len(self.serial_connections)} ESP32 connections")
+
+    def connect_esp32(self, esp32_id, port):
+        """Connect to individual ESP32"""
+        try:
+            # Non-blocking: the shared selector loop decides when the fd
+            # is readable
+            ser = serial.Serial(
+                port=port,
+                baudrate=self.config['esp32']['baud_rate'],
+                timeout=0
+            )
+
+            self.serial_connections[esp32_id] = ser
+
+            # Per-port state for the shared reader: id and leftover buffer
+            self._selector.register(ser.fileno(), selectors.EVENT_READ,
+                                    data=(esp32_id, bytearray()))
+
+            self.logger.info(f"Connected to ESP32 #{esp32_id} on {port}")
+
+        except serial.SerialException as e:
+            self.logger.error(f"Could not connect to ESP32 on {port}: {e}")
+            raise
+
+    def _read_serial_loop(self):
+        """Service all ESP32 ports from one selector-driven thread"""
+        # Restart wrapper: the per-pass body carries no blanket handler,
+        # so only the genuinely recoverable read errors are caught inline
+        # and anything unexpected is logged with a traceback
+        while self.running:
+            try:
+                self._read_serial_iter()
+            except Exception:
+                self.logger.exception("Error in serial reader")
+                time.sleep(0.1)
+
+    def _read_serial_iter(self):
+        """One selector pass: drain every readable port into its buffer"""
+        events = self._selector.select(timeout=1.0)
+
+        for key, _ in events:
+            esp32_id, buf = key.data
+            try:
+                # Drain whatever the UART has buffered in one read(),
+                # then carve complete lines out of the per-port buffer
+                chunk = os.read(key.fd, 4096)
+            except OSError as e:
+                self.logger.error(f"Error reading from ESP32 #{esp32_id}: {e}")
+                continue
+
+            if not chunk:
+                continue
+
+            buf += chunk
+            while True:
+                nl = buf.find(b'\n')
+                if nl < 0:
+                    break
+                line = bytes(buf[:nl])
+                del buf[:nl + 1]
+                if line:
+                    self._parse_esp32_data(esp32_id, line)
+
+    def _parse_esp32_data(self, esp32_id, data_line):
+        """Parse a raw line received from ESP32"""
+        # Expected format: b"DEVICE:MAC_ADDRESS:RSSI:TYPE"
+        # Example: b"DEVICE:AA:BB:CC:DD:EE:FF:-45:WiFi"
+        # One regex pass captures the colon-laden MAC correctly, where
+        # the old split(":")/join dance assumed a fixed field count;
+        # the match also validates every field, so no per-line
+        # try/except is needed here - the reader's restart wrapper
+        # handles anything truly unexpected
+        m = _DEVICE_RE.match(data_line)
+        if not m:
+            return
+
+        mac_address = m.group(1).decode()
+        rssi = int(m.group(2))
+        device_type = m.group(3).decode()
+
+        # Add to data queue for processing
+        detection_data = {
+            'esp32_id': esp32_id,
+            'mac_address': mac_address,
+            'rssi': rssi,
+            'device_type': device_type,
+            'timestamp': time.time(),
+            'position': self.esp32_positions[esp32_id]
+        }
+
+        self.data_queue.put(detection_data)
+
+        # %-style args defer interpolation to the logging module, which
+        # skips it entirely below DEBUG level - no per-packet string
+        # build, and verbosity is controlled by log_level alone instead
+        # of a second debug_mode flag
+        self.logger.debug("ESP32 #%d detected: %s (%d dBm)",
+                          esp32_id, mac_address, rssi)
+
+    def _process_data(self):
+        """Process queued RF detection data"""
+        # Restart wrapper: the batch body only catches queue.Empty, the
+        # one exception it expects, so the hot path never resets blanket
+        # exception state and real bugs get a traceback instead of a
+        # one-line error per batch
+        while self.running:
+            try:
+                self._process_data_iter()
+            except Exception:
+                self.logger.exception("Error processing RF data")
+                time.sleep(0.1)
+
+    def _process_data_iter(self):
+        """One processing pass: block for a detection, drain the burst"""
+        # Block on the queue: a producer's put() wakes this thread
+        # immediately instead of after the old 100ms poll interval
+        try:
+            detection = self.data_queue.get(timeout=1.0)
+        except Empty:
+            return
+
+        self._update_device_tracking(detection)
+
+        # Drain any burst in the same pass to amortize lock traffic
+        while True:
+            try:
+                detection = self.data_queue.get_nowait()
+            except Empty:
+                break
+            self._update_device_tracking(detection)
+
+        # One change notification per batch
+        if self.on_update:
+            self.on_update()
+        if self.activity_event:
+            self.activity_event.set()
+
+    def _update_device_tracking(self, detection):
+        """Update device tracking with new detection"""
+        mac = detection['mac_address']
+
+        # Initialize device tracking if new device
+        if mac not in self.detected_devices:
+            self.detected_devices[mac] = {
+                'first_seen': detection['timestamp'],
+                'last_seen': detection['timestamp'],
+                'detections': deque(),
+                'estimated_position': None,
+                # Running aggregates kept in sync as detections come and
+                # go, so confidence scoring never rescans the history
+                'esp32_counts': {},
+                'rssi_sum': 0.0,
+                'rssi_count': 0,
+                # Most recent (rssi, timestamp) per ESP32, so position
+                # estimation doesn't rescan the full detection history
+                'latest_by_esp32': {},
+                # Display forms cached once so the GUI doesn't re-slice the
+                # MAC string on every refresh
+                '_mac8': mac[:8],
+                '_mac17': mac[:17]
+            }
+
+            # Mirror the new device into the SoA arrays, doubling on growth
+            idx = len(self._macs)
+            if idx == len(self._last_seen):
+                self._last_seen = np.concatenate(
+                    (self._last_seen, np.zeros_like(self._last_seen))
+                )
+            self._mac_index[mac] = idx
+            self._macs.append(mac)
+
+        # Update device info
+        device = self.detected_devices[mac]
+        device['last_seen'] = detection['timestamp']
+        self._last_seen[self._mac_index[mac]] = detection['timestamp']
+        detections = device['detections']
+        detections.append(detection)
+        device['latest_by_esp32'][detection['esp32_id']] = (
+            detection['rssi'], detection['timestamp']
+        )
+
+        esp32_counts = device['esp32_counts']
+        esp32_id = detection['esp32_id']
+        esp32_counts[esp32_id] = esp32_counts.get(esp32_id, 0) + 1
+        device['rssi_sum'] += detection['rssi']
+        device['rssi_count'] += 1
+
+        # Keep only recent detections (last 30 seconds): pop expired ones
+        # off the left and back their contribution out of the aggregates
+        cutoff_time = detection['timestamp'] - 30
+        while detections and detections[0]['timestamp'] <= cutoff_time:
+            old = detections.popleft()
+            old_id = old['esp32_id']
+            esp32_counts[old_id] -= 1
+            if not esp32_counts[old_id]:
+                del esp32_counts[old_id]
+            device['rssi_sum'] -= old['rssi']
+            device['rssi_count'] -= 1
+
+        # Estimate position if we have multiple ESP32 detections
+        self._estimate_device_position(mac)
+
+    def _estimate_device_position(self, mac_address):
+        """Estimate device position using RSSI triangulation"""
+        if mac_address not in self.detected_devices:
+            return
+
+        device = self.detected_devices[mac_address]
+        latest_by_esp32 = device['latest_by_esp32']
+
+        # Need at least 3 ESP32 detections for triangulation
+        if len(latest_by_esp32) >= 3:
+            from utils import trilaterate
+
+            esp32_ids = sorted(latest_by_esp32.keys())
+            positions = [self.esp32_positions[esp32_id] for esp32_id in esp32_ids]
+
+            # Batch RSSI -> distance in the compiled kernel: one call
+            # instead of a Python-level 10 ** (...) per ESP32
+            rssi_arr = np.fromiter(
+                (latest_by_esp32[esp32_id][0] for esp32_id in esp32_ids),
+                dtype=np.float32
+            )
+            distances = rssi_to_distance_arr(rssi_arr)
+
+            # Perform triangulation
+            if len(esp32_ids) == 4 and self.esp32_positions == _DEFAULT_GRID:
+                # All four corner scanners report: subtracting the circle
+                # equations pairwise gives x and y in closed form, averaged
+                # over the redundant opposite pair -- no general solve needed
+                d0, d1, d2, d3 = (float(d) for d in distances)
+                x = ((d0 * d0 - d1 * d1 + 10000.0)
+                     + (d2 * d2 - d3 * d3 + 10000.0)) / 400.0
+                y = ((d0 * d0 - d2 * d2 + 10000.0)
+                     + (d1 * d1 - d3 * d3 + 10000.0)) / 400.0
+                estimated_pos = (x, y)
+            else:
+                estimated_pos = trilaterate(distances.tolist(), positions)
+            if estimated_pos:
+                device['estimated_position'] = estimated_pos
+                self.logger.debug("Device %s estimated position: %s",
+                                  mac_address, estimated_pos)
+
+    def _rssi_to_distance(self, rssi):
+        """Convert RSSI to approximate distance in meters"""
+        if rssi == 0:
+            return -1.0
+
+        # Simple path loss model: RSSI = -10*n*log10(d) + A
+        # Where n=2 (free space), A=-30 (reference RSSI at 1m)
+        # Solving for d: d = 10^((A - RSSI) / (10 * n))
+        n = 2.0  # Path loss exponent
+        A = -30  # Reference RSSI at 1 meter
+
+        distance = 10 ** ((A - rssi) / (10 * n))
+        return max(distance, 0.1)  # Minimum 10cm
+
+    def get_detected_devices(self):
+        """Get currently detected devices"""
+        current_time = time.time()
+
+        # Only include devices seen in last 10 seconds: one vectorized
+        # compare over the last-seen array, then dict lookups for the hits
+        n = len(self._macs)
+        active = np.nonzero(current_time - self._last_seen[:n] <= 10.0)[0]
+
+        detected = self.detected_devices
+        macs = self._macs
+        return {macs[i]: detected[macs[i]] for i in active}
+
+    def get_estimated_positions(self):
+        """Get estimated positions of detected devices"""
+        positions = []
+        active_devices = self.get_detected_devices()
+
+        for mac, device in active_devices.items():
+            if device['estimated_position']:
+                positions.append({
+                    'mac_address': mac,
+                    'position': device['estimated_position'],
+                    'confidence': self._calculate_position_confidence(device)
+                })
+
+        return positions
+
+    def _calculate_position_confidence(self, device):
+        """Calculate confidence in position estimate"""
+        # Confidence based on number of ESP32s detecting the device
+        # and signal strength, read from the running aggregates
+        if not device['rssi_count']:
+            return 0.0
+
+        # Scalar inputs only, so the kernel stays JIT-compilable
+        avg_rssi = device['rssi_sum'] / device['rssi_count']
+        return position_confidence(len(device['esp32_counts']), avg_rssi)
+
+    def stop(self):
+        """Stop RF receiver"""
+        self.running = False
+        self.logger.info("Stopping RF Receiver...")
+
+        # Stop watching the ports, then close all serial connections
+        if self._selector:
+            try:
+                self._selector.close()
+            except:
+                pass
+
+        for ser in self.serial_connections.values():
+            try:
+                ser.close()
+            except:
+                pass
+
+        # Wait for threads to finish
+        for thread in self.threads:
+            thread.join(timeout=2)
+
+        self.logger.info("RF Receiver stopped")
+
+# Test function
+def test_rf_receiver():
+    """Test RF receiver functionality"""
+    from utils import load_config, setup_logging
+
+    config = load_config()
+    if not config:
+        print("Failed to load config")
+        return
+
+    setup_logging(config['system']['log_level'])
+
+    rf_receiver = RFReceiver(config)
+
+    try:
+        rf_receiver.start()
+
+        # Run for 30 seconds for testing
+        for i in range(30):
+            time.sleep(1)
+            devices = rf_receiver.get_detected_devices()
+            positions = rf_receiver.get_estimated_positions()
+
+            print(f"\rActive devices: {len(devices)}, Positions: {len(positions)}", end="")
+
+        print("\nTest completed")
+
+    except KeyboardInterrupt:
+        print("\nTest interrupted")
+    finally:
+        rf_receiver.stop()
+
+if __name__ == "__main__":
+    test_rf_receiver()
@@ -3,6 +3,8 @@ ExamShield Utility Functions
 Provides common utility functions for the ExamShield system
 """
 
+import atexit
+import functools
 import json
 import logging
 import os
@@ -10,16 +12,26 @@ import time
 from datetime import datetime
 import math
 
+# orjson is optional: a faster parser when installed, stdlib json
+# otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@functools.lru_cache(maxsize=4)
 def load_config(config_path="config.json"):
-    """Load configuration from JSON file"""
+    """Load configuration from JSON file (parsed once per path)"""
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        return config
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
     except FileNotFoundError:
         logging.error(f"Configuration file {config_path} not found")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logging.error(f"Error parsing configuration file: {e}")
         return None
 
@@ -38,57 +50,82 @@ def setup_logging(log_level="INFO", log_file="data/detections.log"):
 
     return logging.getLogger(__name__)
 
+def rssi_to_distance_batch(rssis):
+    """
+    Convert an array of RSSI values to approximate distances in one
+    vectorized pass (simplified RSSI-to-distance conversion)
+    """
+    import numpy as np
+
+    r = np.asarray(rssis, dtype=np.float64)
+    out = np.empty_like(r)
+
+    zero = r == 0
+    near = ~zero & (r < 1.0)
+    far = ~zero & (r >= 1.0)
+
+    # Each power is evaluated only on the values its branch owns: with
+    # np.where both sides run over the full array, and the fractional
+    # power of the (negative) RSSI values produced NaNs plus a
+    # RuntimeWarning on every call
+    out[zero] = -1.0
+    out[near] = np.power(r[near], 10)
+    out[far] = 0.89976 * np.power(r[far], 7.7095) + 0.111
+    return out
+
 def calculate_distance(rssi1, rssi2, rssi3, rssi4):
     """
     Calculate approximate position based on RSSI triangulation
     Using simplified RSSI-to-distance conversion
     """
-    def rssi_to_distance(rssi):
-        # Simple RSSI to distance conversion (approximate)
-        if rssi == 0:
-            return -1.0
+    return rssi_to_distance_batch([rssi1, rssi2, rssi3, rssi4]).tolist()
 
-        ratio = rssi * 1.0
-        if ratio < 1.0:
-            return math.pow(ratio, 10)
-        else:
-            accuracy = (0.89976) * math.pow(ratio, 7.7095) + 0.111
-            return accuracy
+@functools.lru_cache(maxsize=8)
+def _tri_solver(positions):
+    """
+    Precompute the anchor-dependent half of trilateration
 
-    distances = [rssi_to_distance(rssi) for rssi in [rssi1, rssi2, rssi3, rssi4]]
-    return distances
+    Subtracting the first circle equation from each of the others
+    linearizes the system; the coefficient matrix and the anchor-only
+    constant terms depend only on scanner positions, which are fixed
+    per installation, so their pseudoinverse is cached per layout.
+    Returns (pinv, constants) or None for degenerate (collinear) layouts.
+    """
+    import numpy as np
+
+    anchors = np.asarray(positions, dtype=float)
+    x1, y1 = anchors[0]
+    m = 2.0 * (anchors[1:] - anchors[0])
+    if np.linalg.matrix_rank(m) < 2:
+        return None
+
+    consts = (anchors[1:, 0] ** 2 - x1 ** 2
+              + anchors[1:, 1] ** 2 - y1 ** 2)
+    return np.linalg.pinv(m), consts
 
 def trilaterate(distances, positions):
     """
     Simple trilateration to estimate position
     positions: list of (x, y) coordinates of ESP32 scanners
     distances: corresponding distances from each scanner
+    Uses every anchor provided (least squares beyond three).
     """
-    # Simplified 2D trilateration using first 3 points
+    import numpy as np
+
     if len(distances) < 3 or len(positions) < 3:
         return None
 
-    x1, y1 = positions[0]
-    x2, y2 = positions[1]
-    x3, y3 = positions[2]
-
-    r1, r2, r3 = distances[0], distances[1], distances[2]
-
-    # Trilateration calculation
-    A = 2 * (x2 - x1)
-    B = 2 * (y2 - y1)
-    C = r1**2 - r2**2 - x1**2 + x2**2 - y1**2 + y2**2
-    D = 2 * (x3 - x2)
-    E = 2 * (y3 - y2)
-    F = r2**2 - r3**2 - x2**2 + x3**2 - y2**2 + y3**2
-
-    try:
-        x = (C * E - F * B) / (E * A - B * D)
-        y = (A * F - D * C) / (A * E - B * D)
-        return (x, y)
-    except ZeroDivisionError:
+    n = min(len(distances), len(positions))
+    solver = _tri_solver(tuple(map(tuple, positions[:n])))
+    if solver is None:
         return None
 
+    # Only the radii vary per call: one tiny matvec finishes the solve
+    pinv, consts = solver
+    r = np.asarray(distances[:n], dtype=float) ** 2
+    x, y = pinv @ (r[0] - r[1:] + consts)
+    return (x, y)
+
 def detect_hotspots(thermal_frame, temp_threshold=30, min_size=3, max_size=20):
     """
     Detect potential device hotspots in thermal image
@@ -96,28 +133,24 @@ def detect_hotspots(thermal_frame, temp_threshold=30, min_size=3, max_size=20):
     """
     import cv2
     import numpy as np
+    from _thermal_kernels import label_and_stats
 
     # Threshold the thermal image
-    _, binary = cv2.threshold(thermal_frame.astype(np.uint8), 
+    _, binary = cv2.threshold(thermal_frame.astype(np.uint8),
                              temp_threshold, 255, cv2.THRESH_BINARY)
 
-    # Find contours
-    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    # One compiled pass labels every blob and returns its stats, instead
+    # of a findContours call plus per-contour moments round-trips
+    areas, cxs, cys, _ = label_and_stats(binary, thermal_frame)
 
     hotspots = []
-    for contour in contours:
-        area = cv2.contourArea(contour)
+    for k in range(len(areas)):
+        area = int(areas[k])
         if min_size <= area <= max_size:
-            # Get centroid
-            M = cv2.moments(contour)
-            if M["m00"] != 0:
-                cx = int(M["m10"] / M["m00"])
-                cy = int(M["m01"] / M["m00"])
-                hotspots.append({
-                    'position': (cx, cy),
-                    'area': area,
-                    'contour': contour
-                })
+            hotspots.append({
+                'position': (int(cxs[k]), int(cys[k])),
+                'area': area
+            })
 
     return hotspots
 
@@ -126,80 +159,122 @@ def correlate_rf_thermal(rf_positions, thermal_hotspots, threshold=50):
     Correlate RF detection positions with thermal hotspots
     Returns list of correlated detections
     """
+    import numpy as np
+
+    rf_positions = [pos for pos in rf_positions if pos is not None]
+    if not rf_positions or not thermal_hotspots:
+        return []
+
     correlations = []
 
-    for rf_pos in rf_positions:
-        if rf_pos is None:
-            continue
-
-        for hotspot in thermal_hotspots:
-            thermal_pos = hotspot['position']
-            distance = math.sqrt(
-                (rf_pos[0] - thermal_pos[0])**2 + 
-                (rf_pos[1] - thermal_pos[1])**2
-            )
-
-            if distance <= threshold:
-                correlations.append({
-                    'rf_position': rf_pos,
-                    'thermal_position': thermal_pos,
-                    'correlation_distance': distance,
-                    'hotspot_area': hotspot['area'],
-                    'confidence': 1.0 - (distance / threshold)
-                })
+    def add_correlation(rf_pos, hotspot, distance):
+        correlations.append({
+            'rf_position': rf_pos,
+            'thermal_position': hotspot['position'],
+            'correlation_distance': distance,
+            'hotspot_area': hotspot['area'],
+            'confidence': 1.0 - (distance / threshold)
+        })
+
+    # For small sets one broadcast distance matrix beats KD-tree
+    # construction cost; above that, query_ball_point keeps the work
+    # proportional to the matching pairs instead of the full product
+    if len(rf_positions) * len(thermal_hotspots) < 400:
+        rf = np.asarray(rf_positions, dtype=float)
+        hp = np.asarray([hotspot['position'] for hotspot in thermal_hotspots],
+                        dtype=float)
+        d = np.hypot(rf[:, None, 0] - hp[None, :, 0],
+                     rf[:, None, 1] - hp[None, :, 1])
+        for i, j in np.argwhere(d <= threshold):
+            add_correlation(rf_positions[i], thermal_hotspots[j],
+                            float(d[i, j]))
+    else:
+        from scipy.spatial import cKDTree
+
+        tree = cKDTree([hotspot['position'] for hotspot in thermal_hotspots])
+        pairs = tree.query_ball_point(np.asarray(rf_positions, dtype=float),
+                                      r=threshold)
+        for i, hotspot_indices in enumerate(pairs):
+            rf_pos = rf_positions[i]
+            for j in hotspot_indices:
+                hotspot = thermal_hotspots[j]
+                thermal_pos = hotspot['position']
+                distance = math.hypot(rf_pos[0] - thermal_pos[0],
+                                      rf_pos[1] - thermal_pos[1])
+                add_correlation(rf_pos, hotspot, distance)
 
     return correlations
 
+# Detections CSV handle, opened once on first use: reopening (makedirs,
+# stat, open, close) per event was a syscall storm on the detection path
+_csv_fh = None
+
+def _get_csv():
+    """Lazily open the detections CSV for append, writing the header once"""
+    global _csv_fh
+    if _csv_fh is None:
+        csv_file = "data/detections.csv"
+        os.makedirs(os.path.dirname(csv_file), exist_ok=True)
+        _csv_fh = open(csv_file, 'a', buffering=1)
+        if os.path.getsize(csv_file) == 0:
+            _csv_fh.write("timestamp,device_mac,position_x,position_y,detection_type,confidence\n")
+        atexit.register(_csv_fh.close)
+    return _csv_fh
+
 def log_detection(device_mac, position, detection_type, confidence):
     """Log a detection event"""
     timestamp = datetime.now().isoformat()
-    log_entry = {
-        'timestamp': timestamp,
-        'device_mac': device_mac,
-        'position': position,
-        'detection_type': detection_type,
-        'confidence': confidence
-    }
-
-    logging.info(f"Detection: {log_entry}")
 
-    # Also save to CSV for analysis
-    csv_file = "data/detections.csv"
-    os.makedirs(os.path.dirname(csv_file), exist_ok=True)
+    # %-style args defer interpolation to the logging module, which
+    # skips it entirely when INFO is filtered out
+    logging.info("Detection: mac=%s position=%s type=%s confidence=%s",
+                 device_mac, position, detection_type, confidence)
 
-    file_exists = os.path.isfile(csv_file)
-    with open(csv_file, 'a') as f:
-        if not file_exists:
-            f.write("timestamp,device_mac,position_x,position_y,detection_type,confidence\n")
-
-        pos_x = position[0] if position else 0
-        pos_y = position[1] if position else 0
-        f.write(f"{timestamp},{device_mac},{pos_x},{pos_y},{detection_type},{confidence}\n")
+    # Also save to CSV for analysis (line-buffered persistent handle)
+    pos_x = position[0] if position else 0
+    pos_y = position[1] if position else 0
+    _get_csv().write(f"{timestamp},{device_mac},{pos_x},{pos_y},{detection_type},{confidence}\n")
 
 def cleanup_old_data(retention_days=30):
     """Clean up old detection data"""
     cutoff_time = time.time() - (retention_days * 24 * 60 * 60)
 
-    # Clean up thermal images
+    # Clean up thermal images: scandir serves each entry's stat from the
+    # directory read instead of a separate stat() per file, and one
+    # summary log line replaces a log write per removal
     thermal_dir = "data/thermal_images"
     if os.path.exists(thermal_dir):
-        for filename in os.listdir(thermal_dir):
-            filepath = os.path.join(thermal_dir, filename)
-            if os.path.getctime(filepath) < cutoff_time:
-                os.remove(filepath)
-                logging.info(f"Cleaned up old thermal image: {filename}")
+        removed = 0
+        with os.scandir(thermal_dir) as entries:
+            for entry in entries:
+                if entry.stat().st_ctime < cutoff_time:
+                    os.remove(entry.path)
+                    removed += 1
+        if removed:
+            logging.info("Cleaned up %d old thermal images", removed)
+
+def make_servo_mapper(image_width=32, image_height=24,
+                      servo_range_x=180, servo_range_y=180):
+    """
+    Build a coordinate-to-servo-angle mapper for a fixed geometry
+
+    The sensor and servo ranges are installation constants, so the
+    scale factors are folded in once here; the returned closure does a
+    single multiply and clamp per axis, for use in the pointing loop.
+    """
+    kx = servo_range_x / image_width
+    ky = servo_range_y / image_height
 
-def convert_servo_angle(x, y, image_width=32, image_height=24, 
+    def to_angles(x, y):
+        return (max(0, min(int(x * kx), servo_range_x)),
+                max(0, min(int(y * ky), servo_range_y)))
+
+    return to_angles
+
+def convert_servo_angle(x, y, image_width=32, image_height=24,
                        servo_range_x=180, servo_range_y=180):
     """
     Convert image coordinates to servo angles for laser pointing
     """
-    # Convert image coordinates to servo angles
-    angle_x = int((x / image_width) * servo_range_x)
-    angle_y = int((y / image_height) * servo_range_y)
-
-    # Clamp to servo range
-    angle_x = max(0, min(angle_x, servo_range_x))
-    angle_y = max(0, min(angle_y, servo_range_y))
-
-    return angle_x, angle_y
+    return make_servo_mapper(image_width, image_height,
+                             servo_range_x, servo_range_y)(x, y)